@@ -21,26 +21,29 @@ logger = logging.getLogger(__name__)
 # Create server
 server = Server("minimal-test")
 
+# The tool list is static, so build it once and serve the same objects on every request
+TOOLS = [
+    types.Tool(
+        name="test_tool",
+        description="A simple test tool",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "Test message"
+                }
+            },
+            "required": ["message"]
+        }
+    )
+]
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available tools."""
     logger.info("Tools list requested")
-    return [
-        types.Tool(
-            name="test_tool",
-            description="A simple test tool",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": "Test message"
-                    }
-                },
-                "required": ["message"]
-            }
-        )
-    ]
+    return TOOLS
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
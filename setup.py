@@ -62,7 +62,7 @@ setup(
         "whois": ["python-whois>=0.8.0"],
         "dev": [
             "pytest>=7.4.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "black>=23.7.0",
             "isort>=5.12.0",
             "mypy>=1.5.0",
@@ -18,15 +18,20 @@ logger = structlog.get_logger(__name__)
 class FinancialDataAdapter:
     """Adapter for financial market data from multiple sources."""
     
-    def __init__(self, cache_manager: CacheManager):
+    def __init__(self, cache_manager: CacheManager, client: Optional[httpx.AsyncClient] = None):
         self.cache = cache_manager
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # Use a shared client when given (the server's); otherwise own a private one
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(timeout=30.0)
+        self.client = client
         
     async def __aenter__(self):
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
     
     @staticmethod
     def _clean_symbol(symbol: str) -> str:
@@ -16,18 +16,23 @@ logger = structlog.get_logger(__name__)
 class GeographicDataAdapter:
     """Adapter for geographic and environmental data sources using real APIs."""
     
-    def __init__(self, cache_manager: CacheManager):
+    def __init__(self, cache_manager: CacheManager, client: Optional[httpx.AsyncClient] = None):
         self.cache = cache_manager
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            headers={"User-Agent": "Universal-Public-Data-MCP/1.0"}
-        )
+        # Use a shared client when given (the server's); otherwise own a private one
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=30.0,
+                headers={"User-Agent": "Universal-Public-Data-MCP/1.0"}
+            )
+        self.client = client
     
     async def __aenter__(self):
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
     
     async def get_weather_data(
         self, 
@@ -455,4 +460,38 @@ class GeographicDataAdapter:
                 "error": f"Failed to get disaster alerts: {str(e)}",
                 "location": location,
                 "timestamp": datetime.now().isoformat()
-            } 
\ No newline at end of file
+            }
+    
+    async def get_location_snapshot(
+        self, 
+        location: str, 
+        units: str = "metric"
+    ) -> Dict[str, Any]:
+        """
+        Get current weather, air quality and disaster alerts for a location in one call.
+        
+        The three lookups are independent, so they run concurrently and the
+        snapshot takes as long as the slowest one rather than their sum.
+        
+        Args:
+            location: City, state, or coordinates
+            units: Temperature units for the weather section (metric/imperial)
+        """
+        weather, air_quality, disaster_alerts = await asyncio.gather(
+            self.get_weather_data(location, units=units),
+            self.get_air_quality(location),
+            self.get_disaster_alerts(location),
+            return_exceptions=True
+        )
+        
+        result = {
+            "location": location,
+            "timestamp": datetime.now().isoformat()
+        }
+        for section, data in (("weather", weather), ("air_quality", air_quality), ("disaster_alerts", disaster_alerts)):
+            if isinstance(data, Exception):
+                logger.error("Location snapshot section failed", location=location, section=section, error=str(data))
+                data = {"error": f"Failed to get {section.replace('_', ' ')}: {str(data)}"}
+            result[section] = data
+        
+        return result
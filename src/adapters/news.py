@@ -18,12 +18,16 @@ logger = structlog.get_logger(__name__)
 class NewsDataAdapter:
     """Adapter for news and media data sources using real APIs."""
     
-    def __init__(self, cache_manager: CacheManager):
+    def __init__(self, cache_manager: CacheManager, client: Optional[httpx.AsyncClient] = None):
         self.cache = cache_manager
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            headers={"User-Agent": "Universal-Public-Data-MCP/1.0"}
-        )
+        # Use a shared client when given (the server's); otherwise own a private one
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=30.0,
+                headers={"User-Agent": "Universal-Public-Data-MCP/1.0"}
+            )
+        self.client = client
         
         # RSS feed sources
         self.rss_feeds = {
@@ -63,7 +67,8 @@ class NewsDataAdapter:
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
     
     async def get_breaking_news(
         self, 
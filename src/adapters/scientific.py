@@ -6,6 +6,7 @@ Uses real scientific APIs for data retrieval with enhanced resilience.
 import asyncio
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
+from functools import partial
 
 import httpx
 import structlog
@@ -25,12 +26,16 @@ logger = structlog.get_logger(__name__)
 class ScientificDataAdapter:
     """Adapter for scientific data sources using real APIs with enhanced resilience."""
     
-    def __init__(self, cache_manager: CacheManager):
+    def __init__(self, cache_manager: CacheManager, client: Optional[httpx.AsyncClient] = None):
         self.cache = cache_manager
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            headers={"User-Agent": "Universal-Public-Data-MCP/1.0"}
-        )
+        # Use a shared client when given (the server's); otherwise own a private one
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=30.0,
+                headers={"User-Agent": "Universal-Public-Data-MCP/1.0"}
+            )
+        self.client = client
         
         # Setup circuit breakers for different services
         self.nasa_circuit = get_circuit_breaker("nasa_api")
@@ -45,7 +50,8 @@ class ScientificDataAdapter:
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
     
     def _setup_fallbacks(self):
         """Setup fallback mechanisms for different services."""
@@ -95,7 +101,6 @@ class ScientificDataAdapter:
             location: Geographic coordinates for Earth data
         """
         
-        @self.nasa_circuit.call
         async def _fetch_nasa_data():
             cache_key = f"nasa:{dataset}:{date or 'latest'}:{location or 'global'}"
             cached_result = await self.cache.get(cache_key)
@@ -280,7 +285,7 @@ class ScientificDataAdapter:
         try:
             return await fallback_manager.execute_with_fallback(
                 "nasa_api",
-                _fetch_nasa_data
+                partial(self.nasa_circuit, _fetch_nasa_data)
             )
         except Exception as e:
             logger.error("Failed to get NASA data", dataset=dataset, error=str(e))
@@ -24,6 +24,9 @@ except (ImportError, TypeError) as e:
 
 logger = structlog.get_logger(__name__)
 
+# Seconds between sweeps of expired memory-cache entries
+EXPIRE_INTERVAL = 5
+
 class CacheManager:
     """
     Manages caching and rate limiting for API requests.
@@ -53,6 +56,9 @@ class CacheManager:
         # Cache warming storage
         self.cache_warming_tasks: Dict[str, asyncio.Task] = {}
         
+        # Periodic expiry sweep, started by the first set on each event loop; stopped by aclose()
+        self._expiry_task: Optional[asyncio.Task] = None
+        
         # Cache statistics
         self.stats = {
             "hits": 0,
@@ -143,6 +149,9 @@ class CacheManager:
             # Always store in memory cache as backup
             self.memory_cache[key] = value
             self.stats["sets"] += 1
+            task = self._expiry_task
+            if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+                self._expiry_task = asyncio.create_task(self._expire_loop())
             return True
             
         except Exception as e:
@@ -150,6 +159,30 @@ class CacheManager:
             logger.warning("Cache set failed", key=key, error=str(e))
             return False
     
+    async def _expire_loop(self):
+        """
+        Drop expired memory-cache entries every EXPIRE_INTERVAL seconds.
+        TTLCache keeps entries in expiry order but only purges them when the
+        cache is used, so without this they outlive their TTL while the server is idle.
+        """
+        while True:
+            await asyncio.sleep(EXPIRE_INTERVAL)
+            self.memory_cache.expire()
+    
+    async def aclose(self):
+        """Stop the expiry sweep and cache warming tasks."""
+        tasks = list(self.cache_warming_tasks.values())
+        if self._expiry_task is not None:
+            tasks.append(self._expiry_task)
+        self.cache_warming_tasks.clear()
+        self._expiry_task = None
+        
+        loop = asyncio.get_running_loop()
+        for task in tasks:
+            task.cancel()
+        # Tasks left behind on another (closed) loop can't be awaited from this one
+        await asyncio.gather(*(t for t in tasks if t.get_loop() is loop), return_exceptions=True)
+    
     async def delete(self, key: str) -> bool:
         """Delete value from cache."""
         try:
@@ -5,15 +5,11 @@ Configuration management for Universal Public Data MCP Server.
 import os
 import sys
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 from pydantic import BaseModel, Field
-import yaml
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Configure logger to use stderr for MCP compatibility
 logger = logging.getLogger(__name__)
@@ -23,6 +19,48 @@ if not logger.handlers:
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
 
+_dotenv_loaded = False
+
+def _load_dotenv_once() -> None:
+    """Load variables from a .env file the first time configuration is loaded."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    
+    from dotenv import load_dotenv
+    load_dotenv()
+    _dotenv_loaded = True
+
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+@lru_cache(maxsize=32)
+def _is_true(value: str) -> bool:
+    """Parse a boolean environment variable value (1/true/yes/on/y/t, case-insensitive)."""
+    return value.strip().lower() in _TRUTHY
+
+# Environment variable overrides: (env var, section, key, caster)
+_ENV_SETTINGS = (
+    ("DEBUG", "server", "debug", _is_true),
+    ("LOG_LEVEL", "server", "log_level", str),
+    ("CACHE_ENABLED", "cache", "enabled", _is_true),
+    ("CACHE_TTL", "cache", "default_ttl", int),
+    ("REDIS_ENABLED", "cache", "redis_enabled", _is_true),
+    ("REDIS_URL", "cache", "redis_url", str),
+    ("CACHE_PREHEAT", "cache", "preheat_enabled", _is_true),
+    ("RATE_LIMIT_ENABLED", "rate_limit", "enabled", _is_true),
+    ("REQUESTS_PER_MINUTE", "rate_limit", "requests_per_minute", int),
+)
+
+# API keys read from the environment: (env var, section, key)
+_API_KEY_MAP = (
+    ("NASA_API_KEY", "api_keys", "nasa"),
+    ("ALPHA_VANTAGE_API_KEY", "api_keys", "alpha_vantage"),
+    ("NEWS_API_KEY", "api_keys", "news_api"),
+    ("OPENWEATHER_API_KEY", "api_keys", "openweather"),
+    ("AIRNOW_API_KEY", "api_keys", "airnow"),
+    ("GITHUB_API_KEY", "api_keys", "github"),
+)
+
 class ServerConfig(BaseModel):
     """Server configuration."""
     debug: bool = Field(default=False, description="Enable debug mode")
@@ -35,6 +73,7 @@ class CacheConfig(BaseModel):
     max_size: int = Field(default=1000, description="Maximum cache size")
     redis_enabled: bool = Field(default=False, description="Enable Redis caching")
     redis_url: str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
+    preheat_enabled: bool = Field(default=False, description="Refresh frequently repeated tool calls in the background")
 
 class RateLimitConfig(BaseModel):
     """Rate limiting configuration."""
@@ -79,17 +118,22 @@ class Config(BaseModel):
     apis: APIEndpointsConfig = Field(default_factory=APIEndpointsConfig)
     
     @classmethod
-    def load(cls, config_path: Optional[str] = None) -> "Config":
+    def load(cls, config_path: Optional[str] = None, validate: bool = False) -> "Config":
         """
         Load configuration from file and environment variables with smart defaults.
         
         Args:
             config_path: Path to YAML configuration file
+            validate: Run full pydantic validation even when no config file was merged
             
         Returns:
             Config instance with optimized settings
         """
         config_data = {}
+        file_merged = False
+        
+        # Load environment variables from .env on first use rather than at import
+        _load_dotenv_once()
         
         # Detect environment
         environment = cls._detect_environment()
@@ -101,23 +145,40 @@ class Config(BaseModel):
         # Load from YAML file if provided
         if config_path and Path(config_path).exists():
             try:
+                import yaml
+                
                 with open(config_path, 'r') as f:
                     file_config = yaml.safe_load(f) or {}
-                config_data = cls._merge_configs(config_data, file_config)
+                cls._merge_configs(config_data, file_config)
+                file_merged = True
             except Exception as e:
                 pass  # Fail silently for MCP compatibility
         
         # Override with environment variables
         env_overrides = cls._get_env_overrides()
-        config_data = cls._merge_configs(config_data, env_overrides)
+        cls._merge_configs(config_data, env_overrides)
         
-        # Validate and optimize configuration
-        instance = cls(**config_data)
+        # Built-in defaults and caster-converted env values are already typed, but YAML
+        # values are not (e.g. default_ttl: "600"), so validate whenever a file was merged
+        if validate or file_merged:
+            instance = cls(**config_data)
+        else:
+            instance = cls._construct(config_data)
         instance._validate_configuration()
         # Skip logging configuration summary for MCP compatibility
         
         return instance
     
+    @classmethod
+    def _construct(cls, config_data: Dict[str, Any]) -> "Config":
+        """Build a Config from merged section dicts without pydantic validation."""
+        sections = {
+            name: field.annotation.model_construct(**config_data[name])
+            for name, field in cls.model_fields.items()
+            if isinstance(config_data.get(name), dict)
+        }
+        return cls.model_construct(**sections)
+    
     @staticmethod
     def _detect_environment() -> str:
         """Detect the current environment (colab, docker, local, etc.)."""
@@ -244,62 +305,37 @@ class Config(BaseModel):
     def _get_env_overrides() -> Dict[str, Any]:
         """Extract configuration from environment variables."""
         env_config = {}
+        env = os.environ
         
-        # Server configuration
-        if os.getenv("DEBUG"):
-            env_config.setdefault("server", {})["debug"] = os.getenv("DEBUG").lower() == "true"
-        
-        if os.getenv("LOG_LEVEL"):
-            env_config.setdefault("server", {})["log_level"] = os.getenv("LOG_LEVEL")
-        
-        # Cache configuration
-        if os.getenv("CACHE_ENABLED"):
-            env_config.setdefault("cache", {})["enabled"] = os.getenv("CACHE_ENABLED").lower() == "true"
-        
-        if os.getenv("CACHE_TTL"):
-            env_config.setdefault("cache", {})["default_ttl"] = int(os.getenv("CACHE_TTL"))
-        
-        if os.getenv("REDIS_ENABLED"):
-            env_config.setdefault("cache", {})["redis_enabled"] = os.getenv("REDIS_ENABLED").lower() == "true"
-        
-        if os.getenv("REDIS_URL"):
-            env_config.setdefault("cache", {})["redis_url"] = os.getenv("REDIS_URL")
-        
-        # Rate limiting
-        if os.getenv("RATE_LIMIT_ENABLED"):
-            env_config.setdefault("rate_limit", {})["enabled"] = os.getenv("RATE_LIMIT_ENABLED").lower() == "true"
-        
-        if os.getenv("REQUESTS_PER_MINUTE"):
-            env_config.setdefault("rate_limit", {})["requests_per_minute"] = int(os.getenv("REQUESTS_PER_MINUTE"))
+        # Server, cache and rate limiting settings
+        for env_key, section, config_key, caster in _ENV_SETTINGS:
+            value = env.get(env_key)
+            if value:
+                env_config.setdefault(section, {})[config_key] = caster(value)
         
         # API keys from environment
-        api_key_mapping = {
-            "NASA_API_KEY": ("api_keys", "nasa"),
-            "ALPHA_VANTAGE_API_KEY": ("api_keys", "alpha_vantage"),
-            "NEWS_API_KEY": ("api_keys", "news_api"),
-            "OPENWEATHER_API_KEY": ("api_keys", "openweather"),
-            "AIRNOW_API_KEY": ("api_keys", "airnow"),
-            "GITHUB_API_KEY": ("api_keys", "github"),
-        }
-        
-        for env_key, (section, config_key) in api_key_mapping.items():
-            if os.getenv(env_key):
-                env_config.setdefault(section, {})[config_key] = os.getenv(env_key)
+        for env_key, section, config_key in _API_KEY_MAP:
+            value = env.get(env_key)
+            if value:
+                env_config.setdefault(section, {})[config_key] = value
         
         return env_config
     
     @staticmethod
     def _merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively merge configuration dictionaries."""
-        result = base.copy()
-        
+        """Recursively merge override into base in place and return base."""
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = Config._merge_configs(result[key], value)
+            if key not in base:
+                base[key] = value
+                continue
+            
+            current = base[key]
+            if type(current) is dict and type(value) is dict:
+                Config._merge_configs(current, value)
             else:
-                result[key] = value
+                base[key] = value
         
-        return result
+        return base
 
 # Global configuration instance
 config = Config() 
\ No newline at end of file
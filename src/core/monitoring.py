@@ -3,23 +3,130 @@ Monitoring and metrics collection for Universal Public Data MCP Server.
 """
 
 import asyncio
+import sys
 import time
 import psutil
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
-from dataclasses import dataclass
+from itertools import chain, islice, repeat
 
 import structlog
 
+# Optional numpy support for compact numeric metric histories
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 logger = structlog.get_logger(__name__)
 
-@dataclass
-class MetricPoint:
-    """Single metric data point."""
-    timestamp: datetime
+def _tail(items: deque, limit: int):
+    """Iterate over the last `limit` items of a deque without copying it (all items if limit <= 0)."""
+    count = len(items)
+    start = max(0, count - limit) if limit > 0 else 0
+    return islice(items, start, count)
+
+class MetricPoint(NamedTuple):
+    """Single metric data point (timestamp is wall-clock seconds since the epoch).
+    
+    Histories store plain (timestamp, value, tags) tuples with the same layout.
+    """
+    timestamp: float
     value: float
-    tags: Dict[str, str]
+    tags: Optional[Dict[str, str]]
+
+class _ApiStats:
+    """Per-API request counters."""
+    
+    __slots__ = ("requests", "errors", "total_time_ns", "last_request")
+    
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_time_ns = 0
+        self.last_request: Optional[float] = None
+
+class _NumericSeries:
+    """Fixed-size ring buffer of tag-less (timestamp, value) points stored as numpy arrays."""
+    
+    __slots__ = ("timestamps", "values", "head", "size")
+    
+    def __init__(self, capacity: int):
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.head = 0
+        self.size = 0
+    
+    def append(self, timestamp: float, value: float):
+        """Write a point over the oldest slot."""
+        self.timestamps[self.head] = timestamp
+        self.values[self.head] = value
+        self.head = (self.head + 1) % len(self.values)
+        if self.size < len(self.values):
+            self.size += 1
+    
+    def latest(self, limit: int):
+        """Return the most recent timestamps and values in chronological order."""
+        count = min(limit, self.size) if limit > 0 else self.size
+        indices = (self.head - count + np.arange(count)) % len(self.values)
+        return self.timestamps[indices], self.values[indices]
+
+class _ApiHistory:
+    """
+    Per-API request history in shared 2D numpy buffers, one row per API.
+    
+    Each request writes its timestamp, response time and error flag into its API's
+    row, which backs the api.<name>.response_time/requests/errors metric histories.
+    """
+    
+    __slots__ = ("capacity", "rows", "timestamps", "response_times", "errors", "heads", "sizes")
+    
+    def __init__(self, capacity: int, initial_rows: int = 64):
+        self.capacity = capacity
+        self.rows: Dict[str, int] = {}
+        self.timestamps = np.zeros((initial_rows, capacity), dtype=np.float64)
+        self.response_times = np.zeros((initial_rows, capacity), dtype=np.float64)
+        self.errors = np.zeros((initial_rows, capacity), dtype=np.bool_)
+        self.heads = [0] * initial_rows
+        self.sizes = [0] * initial_rows
+    
+    def row_for(self, api_name: str) -> int:
+        """Get the row index for an API, allocating one on first use."""
+        row = self.rows.get(api_name)
+        if row is None:
+            row = len(self.rows)
+            if row == len(self.heads):
+                self._grow()
+            self.rows[api_name] = row
+        return row
+    
+    def _grow(self):
+        """Double the number of rows."""
+        self.timestamps = np.vstack((self.timestamps, np.zeros_like(self.timestamps)))
+        self.response_times = np.vstack((self.response_times, np.zeros_like(self.response_times)))
+        self.errors = np.vstack((self.errors, np.zeros_like(self.errors)))
+        self.heads.extend([0] * len(self.heads))
+        self.sizes.extend([0] * len(self.sizes))
+    
+    def append(self, row: int, timestamp: float, response_time: float, failed: bool):
+        """Write a request over the oldest slot of a row."""
+        head = self.heads[row]
+        self.timestamps[row, head] = timestamp
+        self.response_times[row, head] = response_time
+        self.errors[row, head] = failed
+        self.heads[row] = (head + 1) % self.capacity
+        if self.sizes[row] < self.capacity:
+            self.sizes[row] += 1
+    
+    def latest(self, row: int, limit: int):
+        """Return the most recent timestamps, response times and error flags of a row in chronological order."""
+        size = self.sizes[row]
+        count = min(limit, size) if limit > 0 else size
+        indices = (self.heads[row] - count + np.arange(count)) % self.capacity
+        return self.timestamps[row, indices], self.response_times[row, indices], self.errors[row, indices]
 
 class MetricsCollector:
     """Collects and aggregates system metrics."""
@@ -27,64 +134,110 @@ class MetricsCollector:
     def __init__(self, max_history: int = 1000):
         self.max_history = max_history
         self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
-        self.start_time = datetime.now()
+        # Tag-less numeric metrics are kept in numpy ring buffers when available
+        self._num_metrics: Dict[str, _NumericSeries] = {}
+        # Wall-clock start for display, monotonic baseline for uptime
+        self.start_time = time.time()
+        self._start_mono = time.monotonic()
+        
+        # Prime the CPU counter so later non-blocking reads have a baseline
+        psutil.cpu_percent(interval=None)
+        
+        # Short-lived cache for disk and network counters: (monotonic time, value)
+        self._io_cache_ttl = 1.0
+        self._disk_cache = None
+        self._network_cache = None
         
         # Performance counters
         self.request_count = 0
         self.error_count = 0
-        self.total_response_time = 0.0
+        # Response times are summed as integer nanoseconds and converted on export
+        self.total_response_time_ns = 0
         
         # API-specific metrics
-        self.api_metrics = defaultdict(lambda: {
-            "requests": 0,
-            "errors": 0,
-            "total_time": 0.0,
-            "last_request": None
-        })
+        self.api_metrics: Dict[str, _ApiStats] = defaultdict(_ApiStats)
+        
+        # Metric names derived from each API name: (response_time, requests, errors)
+        self._name_cache: Dict[str, Tuple[str, str, str]] = {}
+        
+        # Per-API request histories share one numpy buffer when available;
+        # _api_series maps each derived metric name to (api_name, index into the names tuple)
+        self._api_history = _ApiHistory(max_history) if NUMPY_AVAILABLE else None
+        self._api_series: Dict[str, Tuple[str, int]] = {}
     
     def record_metric(self, name: str, value: float, tags: Optional[Dict[str, str]] = None):
         """Record a metric value."""
-        point = MetricPoint(
-            timestamp=datetime.now(),
-            value=value,
-            tags=tags or {}
-        )
-        self.metrics[name].append(point)
+        if tags is None and NUMPY_AVAILABLE:
+            series = self._num_metrics.get(name)
+            if series is None:
+                series = self._num_metrics[name] = _NumericSeries(self.max_history)
+            series.append(time.time(), value)
+            return
+        
+        self.metrics[name].append((time.time(), value, tags))
     
     def record_request(self, api_name: str, response_time: float, success: bool = True):
-        """Record API request metrics."""
+        """Record API request metrics for a response time in seconds."""
+        self.record_request_ns(api_name, round(response_time * 1e9), success)
+    
+    def record_request_ns(self, api_name: str, response_time_ns: int, success: bool = True):
+        """Record API request metrics for a response time in integer nanoseconds."""
+        names = self._name_cache.get(api_name)
+        if names is None:
+            # First sighting: intern the name and build its metric names once
+            api_name = sys.intern(api_name)
+            names = self._name_cache[api_name] = (
+                f"api.{api_name}.response_time",
+                f"api.{api_name}.requests",
+                f"api.{api_name}.errors"
+            )
+            for index, name in enumerate(names):
+                self._api_series[name] = (api_name, index)
+        
+        now = time.time()
         self.request_count += 1
-        self.total_response_time += response_time
+        self.total_response_time_ns += response_time_ns
         
         api_stats = self.api_metrics[api_name]
-        api_stats["requests"] += 1
-        api_stats["total_time"] += response_time
-        api_stats["last_request"] = datetime.now()
+        api_stats.requests += 1
+        api_stats.total_time_ns += response_time_ns
+        api_stats.last_request = now
         
         if not success:
             self.error_count += 1
-            api_stats["errors"] += 1
+            api_stats.errors += 1
         
         # Record detailed metrics
-        self.record_metric(f"api.{api_name}.response_time", response_time)
-        self.record_metric(f"api.{api_name}.requests", 1)
-        if not success:
-            self.record_metric(f"api.{api_name}.errors", 1)
+        response_time = response_time_ns / 1e9
+        if self._api_history is not None:
+            self._api_history.append(self._api_history.row_for(api_name), now, response_time, not success)
+        else:
+            self.record_metric(names[0], response_time)
+            self.record_metric(names[1], 1)
+            if not success:
+                self.record_metric(names[2], 1)
     
-    def get_system_metrics(self) -> Dict[str, Any]:
-        """Get current system metrics."""
-        # CPU and memory usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+    def get_uptime_seconds(self) -> float:
+        """Get seconds elapsed since the collector was created."""
+        return time.monotonic() - self._start_mono
+    
+    def get_system_metrics(self, uptime_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Get current system metrics, optionally reusing a precomputed uptime."""
+        # CPU and memory usage (non-blocking: delta since the previous call)
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
-        # Network I/O
-        network = psutil.net_io_counters()
         
-        uptime = datetime.now() - self.start_time
+        # Disk and network I/O change slowly, so reuse readings for a short time
+        now = time.monotonic()
+        if self._disk_cache is None or now - self._disk_cache[0] >= self._io_cache_ttl:
+            self._disk_cache = (now, psutil.disk_usage('/'))
+        if self._network_cache is None or now - self._network_cache[0] >= self._io_cache_ttl:
+            self._network_cache = (now, psutil.net_io_counters())
+        disk = self._disk_cache[1]
+        network = self._network_cache[1]
         
         return {
-            "uptime_seconds": uptime.total_seconds(),
+            "uptime_seconds": uptime_seconds if uptime_seconds is not None else self.get_uptime_seconds(),
             "cpu_percent": cpu_percent,
             "memory": {
                 "total": memory.total,
@@ -106,10 +259,10 @@ class MetricsCollector:
             }
         }
     
-    def get_performance_metrics(self) -> Dict[str, Any]:
-        """Get performance metrics."""
-        avg_response_time = (
-            self.total_response_time / self.request_count 
+    def get_performance_metrics(self, uptime_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Get performance metrics, optionally reusing a precomputed uptime."""
+        avg_response_time_ms = (
+            self.total_response_time_ns / self.request_count / 1e6
             if self.request_count > 0 else 0
         )
         
@@ -119,56 +272,108 @@ class MetricsCollector:
         )
         
         # Calculate requests per minute
-        uptime_minutes = (datetime.now() - self.start_time).total_seconds() / 60
+        if uptime_seconds is None:
+            uptime_seconds = self.get_uptime_seconds()
+        uptime_minutes = uptime_seconds / 60
         requests_per_minute = self.request_count / uptime_minutes if uptime_minutes > 0 else 0
         
         return {
             "total_requests": self.request_count,
             "total_errors": self.error_count,
             "error_rate_percent": error_rate,
-            "avg_response_time_ms": avg_response_time * 1000,
+            "avg_response_time_ms": avg_response_time_ms,
             "requests_per_minute": requests_per_minute
         }
     
-    def get_api_metrics(self) -> Dict[str, Any]:
-        """Get per-API metrics."""
-        api_summary = {}
-        
+    def iter_api_metrics(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (api_name, summary) pairs for per-API metrics one at a time."""
         for api_name, stats in self.api_metrics.items():
-            avg_time = (
-                stats["total_time"] / stats["requests"] 
-                if stats["requests"] > 0 else 0
+            avg_time_ms = (
+                stats.total_time_ns / stats.requests / 1e6
+                if stats.requests > 0 else 0
             )
             
             error_rate = (
-                (stats["errors"] / stats["requests"]) * 100 
-                if stats["requests"] > 0 else 0
+                (stats.errors / stats.requests) * 100 
+                if stats.requests > 0 else 0
             )
             
-            api_summary[api_name] = {
-                "requests": stats["requests"],
-                "errors": stats["errors"],
+            yield api_name, {
+                "requests": stats.requests,
+                "errors": stats.errors,
                 "error_rate_percent": error_rate,
-                "avg_response_time_ms": avg_time * 1000,
-                "last_request": stats["last_request"].isoformat() if stats["last_request"] else None
+                "avg_response_time_ms": avg_time_ms,
+                "last_request": datetime.fromtimestamp(stats.last_request).isoformat() if stats.last_request else None
+            }
+    
+    def get_api_metrics(self) -> Dict[str, Any]:
+        """Get per-API metrics."""
+        return dict(self.iter_api_metrics())
+    
+    def iter_metric_history(self, metric_name: str, limit: int = 100) -> Iterator[Dict[str, Any]]:
+        """Yield historical data points for a metric, oldest first, without building a list."""
+        sources = []
+        
+        tagged = self.metrics.get(metric_name)
+        if tagged is not None:
+            sources.append(_tail(tagged, limit))
+        
+        numeric = self._num_metrics.get(metric_name)
+        if numeric is not None:
+            timestamps, values = numeric.latest(limit)
+            sources.append(zip(timestamps.tolist(), values.tolist(), repeat(None)))
+        
+        api_series = self._api_series.get(metric_name)
+        if api_series is not None and self._api_history is not None:
+            sources.append(self._iter_api_series(*api_series, limit))
+        
+        if not sources:
+            return
+        if len(sources) == 1:
+            points = sources[0]
+        else:
+            # Metric was recorded into more than one store
+            points = sorted(chain.from_iterable(sources), key=lambda point: point[0])
+            if limit > 0:
+                points = points[-limit:]
+        
+        for timestamp, value, tags in points:
+            yield {
+                "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+                "value": value,
+                "tags": tags or {}
             }
+    
+    def _iter_api_series(self, api_name: str, index: int, limit: int):
+        """Iterate (timestamp, value, tags) points of one derived api.<name>.* metric."""
+        row = self._api_history.rows[api_name]
         
-        return api_summary
+        if index == 2:
+            # Errors: only failed requests produce a point
+            timestamps, _, errors = self._api_history.latest(row, 0)
+            timestamps = timestamps[errors]
+            if limit > 0:
+                timestamps = timestamps[-limit:]
+            return zip(timestamps.tolist(), repeat(1.0), repeat(None))
+        
+        timestamps, response_times, _ = self._api_history.latest(row, limit)
+        if index == 0:
+            return zip(timestamps.tolist(), response_times.tolist(), repeat(None))
+        return zip(timestamps.tolist(), repeat(1.0), repeat(None))
     
     def get_metric_history(self, metric_name: str, limit: int = 100) -> List[Dict[str, Any]]:
         """Get historical data for a metric."""
-        if metric_name not in self.metrics:
-            return []
-        
-        points = list(self.metrics[metric_name])[-limit:]
-        return [
-            {
-                "timestamp": point.timestamp.isoformat(),
-                "value": point.value,
-                "tags": point.tags
-            }
-            for point in points
-        ]
+        return list(self.iter_metric_history(metric_name, limit))
+
+# Health threshold rules:
+# (snapshot, key path, threshold key, alert type, severity, score penalty, message format)
+_HEALTH_RULES = (
+    ("system", ("cpu_percent",), "cpu_percent", "cpu_high", "warning", 10, "CPU usage high: {:.1f}%"),
+    ("system", ("memory", "percent"), "memory_percent", "memory_high", "warning", 15, "Memory usage high: {:.1f}%"),
+    ("system", ("disk", "percent"), "disk_percent", "disk_high", "critical", 20, "Disk usage high: {:.1f}%"),
+    ("performance", ("error_rate_percent",), "error_rate_percent", "error_rate_high", "critical", 25, "Error rate high: {:.1f}%"),
+    ("performance", ("avg_response_time_ms",), "avg_response_time_ms", "response_time_high", "warning", 10, "Response time high: {:.0f}ms"),
+)
 
 class HealthMonitor:
     """Monitors system health and service availability."""
@@ -196,78 +401,71 @@ class HealthMonitor:
         }
     
     async def run_health_checks(self):
-        """Run all registered health checks."""
+        """Run all registered health checks that are due, concurrently."""
         current_time = datetime.now()
         
-        for name, check_info in self.health_checks.items():
-            # Check if it's time to run this health check
-            if (check_info["last_check"] is None or 
-                (current_time - check_info["last_check"]).total_seconds() >= check_info["interval"]):
-                
-                try:
-                    result = await check_info["function"]()
-                    check_info["status"] = "healthy" if result else "unhealthy"
-                    check_info["message"] = result.get("message", "") if isinstance(result, dict) else None
-                    check_info["last_check"] = current_time
-                    
-                except Exception as e:
-                    check_info["status"] = "error"
-                    check_info["message"] = str(e)
-                    check_info["last_check"] = current_time
-                    logger.error("Health check failed", check=name, error=str(e))
-    
-    def check_system_health(self) -> Dict[str, Any]:
-        """Check overall system health against thresholds."""
-        system_metrics = self.metrics.get_system_metrics()
-        performance_metrics = self.metrics.get_performance_metrics()
+        # Collect the checks whose interval has elapsed
+        due = [
+            (name, check_info)
+            for name, check_info in self.health_checks.items()
+            if (check_info["last_check"] is None or
+                (current_time - check_info["last_check"]).total_seconds() >= check_info["interval"])
+        ]
+        if not due:
+            return
+        
+        results = await asyncio.gather(
+            *(check_info["function"]() for _, check_info in due),
+            return_exceptions=True
+        )
+        
+        for (name, check_info), result in zip(due, results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            
+            if isinstance(result, Exception):
+                check_info["status"] = "error"
+                check_info["message"] = str(result)
+                logger.error("Health check failed", check=name, error=str(result))
+            else:
+                check_info["status"] = "healthy" if result else "unhealthy"
+                check_info["message"] = result.get("message", "") if isinstance(result, dict) else None
+            check_info["last_check"] = current_time
+    
+    def check_system_health(
+        self,
+        system_metrics: Optional[Dict[str, Any]] = None,
+        performance_metrics: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Check overall system health against thresholds.
+        
+        Args:
+            system_metrics: Snapshot from get_system_metrics (collected if omitted)
+            performance_metrics: Snapshot from get_performance_metrics (collected if omitted)
+        """
+        if system_metrics is None:
+            system_metrics = self.metrics.get_system_metrics()
+        if performance_metrics is None:
+            performance_metrics = self.metrics.get_performance_metrics()
         
         alerts = []
         health_score = 100.0
         
-        # Check CPU usage
-        if system_metrics["cpu_percent"] > self.alert_thresholds["cpu_percent"]:
-            alerts.append({
-                "type": "cpu_high",
-                "message": f"CPU usage high: {system_metrics['cpu_percent']:.1f}%",
-                "severity": "warning"
-            })
-            health_score -= 10
-        
-        # Check memory usage
-        if system_metrics["memory"]["percent"] > self.alert_thresholds["memory_percent"]:
-            alerts.append({
-                "type": "memory_high",
-                "message": f"Memory usage high: {system_metrics['memory']['percent']:.1f}%",
-                "severity": "warning"
-            })
-            health_score -= 15
-        
-        # Check disk usage
-        if system_metrics["disk"]["percent"] > self.alert_thresholds["disk_percent"]:
-            alerts.append({
-                "type": "disk_high",
-                "message": f"Disk usage high: {system_metrics['disk']['percent']:.1f}%",
-                "severity": "critical"
-            })
-            health_score -= 20
-        
-        # Check error rate
-        if performance_metrics["error_rate_percent"] > self.alert_thresholds["error_rate_percent"]:
-            alerts.append({
-                "type": "error_rate_high",
-                "message": f"Error rate high: {performance_metrics['error_rate_percent']:.1f}%",
-                "severity": "critical"
-            })
-            health_score -= 25
-        
-        # Check response time
-        if performance_metrics["avg_response_time_ms"] > self.alert_thresholds["avg_response_time_ms"]:
-            alerts.append({
-                "type": "response_time_high",
-                "message": f"Response time high: {performance_metrics['avg_response_time_ms']:.0f}ms",
-                "severity": "warning"
-            })
-            health_score -= 10
+        # Compare each metric against its threshold; alerts are only built when a rule fires
+        snapshots = {"system": system_metrics, "performance": performance_metrics}
+        for source, path, threshold_key, alert_type, severity, weight, message in _HEALTH_RULES:
+            value = snapshots[source]
+            for key in path:
+                value = value[key]
+            
+            if value > self.alert_thresholds[threshold_key]:
+                alerts.append({
+                    "type": alert_type,
+                    "message": message.format(value),
+                    "severity": severity
+                })
+                health_score -= weight
         
         # Store new alerts
         for alert in alerts:
@@ -298,7 +496,7 @@ class HealthMonitor:
     
     def get_recent_alerts(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent alerts."""
-        return list(self.alerts)[-limit:]
+        return list(_tail(self.alerts, limit))
 
 class DashboardGenerator:
     """Generates monitoring dashboard data."""
@@ -312,16 +510,21 @@ class DashboardGenerator:
         # Run health checks
         await self.health.run_health_checks()
         
+        # Take one snapshot and share it with the health check
+        uptime_seconds = self.metrics.get_uptime_seconds()
+        system_metrics = self.metrics.get_system_metrics(uptime_seconds)
+        performance_metrics = self.metrics.get_performance_metrics(uptime_seconds)
+        
         return {
             "timestamp": datetime.now().isoformat(),
-            "system": self.metrics.get_system_metrics(),
-            "performance": self.metrics.get_performance_metrics(),
+            "system": system_metrics,
+            "performance": performance_metrics,
             "apis": self.metrics.get_api_metrics(),
-            "health": self.health.check_system_health(),
+            "health": self.health.check_system_health(system_metrics, performance_metrics),
             "recent_alerts": self.health.get_recent_alerts(),
             "uptime": {
-                "start_time": self.metrics.start_time.isoformat(),
-                "uptime_seconds": (datetime.now() - self.metrics.start_time).total_seconds()
+                "start_time": datetime.fromtimestamp(self.metrics.start_time).isoformat(),
+                "uptime_seconds": uptime_seconds
             }
         }
 
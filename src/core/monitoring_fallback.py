@@ -0,0 +1,20 @@
+"""
+Minimal stand-ins for the monitoring classes, used when core.monitoring
+cannot be imported (e.g. psutil is not installed).
+"""
+
+class MetricsCollector:
+    def record_request(self, api_name, duration, success): pass
+    def record_request_ns(self, api_name, duration_ns, success): pass
+    def get_api_metrics(self): return {}
+
+class HealthMonitor:
+    def __init__(self, metrics_collector=None):
+        self.metrics_collector = metrics_collector
+    async def check_health(self): return {"status": "ok"}
+
+class DashboardGenerator:
+    def __init__(self, metrics_collector, health_monitor):
+        self.metrics = metrics_collector
+        self.health = health_monitor
+    async def generate_dashboard(self): return {"status": "monitoring not available"}
@@ -0,0 +1,114 @@
+"""
+Predictive cache preheating for Universal Public Data MCP Server.
+Tracks how often each call recurs and re-issues the most frequent ones in the
+background, so their cached results are refreshed off the request path.
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, List
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+class CountMinSketch:
+    """
+    Fixed-size frequency estimator. Estimates never undercount and overcount
+    only through hash collisions, however many distinct keys are added.
+    """
+
+    __slots__ = ("width", "depth", "_rows")
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self._rows: List[List[int]] = [[0] * width for _ in range(depth)]
+
+    def add(self, key: Hashable, count: int = 1):
+        width = self.width
+        for seed, row in enumerate(self._rows):
+            row[hash((seed, key)) % width] += count
+
+    def estimate(self, key: Hashable) -> int:
+        width = self.width
+        return min(row[hash((seed, key)) % width] for seed, row in enumerate(self._rows))
+
+    def decay(self):
+        """Halve every counter so old traffic stops counting towards popularity."""
+        for row in self._rows:
+            row[:] = [count >> 1 for count in row]
+
+class Preheater:
+    """
+    Re-issues the most frequently repeated calls every interval.
+
+    Args:
+        refill: Async function re-running one recorded call, given its payload
+        interval: Seconds between preheat rounds
+        top_k: Most calls refilled per round
+        min_count: Estimated recent calls needed before a call is refilled
+        max_candidates: Most recently seen calls kept as refill candidates
+    """
+
+    def __init__(
+        self,
+        refill: Callable[[Any], Awaitable[Any]],
+        interval: float = 30.0,
+        top_k: int = 8,
+        min_count: int = 3,
+        max_candidates: int = 256
+    ):
+        self.refill = refill
+        self.interval = interval
+        self.top_k = top_k
+        self.min_count = min_count
+        self.max_candidates = max_candidates
+
+        self._sketch = CountMinSketch()
+        # Key -> payload passed to refill, oldest first
+        self._candidates: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def record(self, key: Hashable, payload: Any):
+        """Count one occurrence of a call."""
+        self._sketch.add(key)
+        candidates = self._candidates
+        candidates[key] = payload
+        candidates.move_to_end(key)
+        if len(candidates) > self.max_candidates:
+            candidates.popitem(last=False)
+
+    def hot_keys(self) -> List[Hashable]:
+        """Keys seen at least min_count times recently, most frequent first, at most top_k."""
+        estimate = self._sketch.estimate
+        counted = [(estimate(key), key) for key in self._candidates]
+        hot = [(count, key) for count, key in counted if count >= self.min_count]
+        hot.sort(key=lambda item: item[0], reverse=True)
+        return [key for _, key in hot[:self.top_k]]
+
+    async def preheat_once(self):
+        """Refill the current hot calls concurrently, then age all counts."""
+        payloads = [self._candidates[key] for key in self.hot_keys()]
+        if payloads:
+            results = await asyncio.gather(
+                *(self.refill(payload) for payload in payloads),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.debug("Preheat refill failed", error=str(result))
+
+        self._sketch.decay()
+        # Forget calls whose recent traffic has decayed away
+        estimate = self._sketch.estimate
+        for key in [key for key in self._candidates if estimate(key) == 0]:
+            del self._candidates[key]
+
+    async def run(self):
+        """Preheat every interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.preheat_once()
+            except Exception as e:
+                logger.warning("Preheat round failed", error=str(e))
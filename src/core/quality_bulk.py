@@ -0,0 +1,125 @@
+"""
+Column-oriented validation helpers for large list payloads.
+Evaluates checks per column (pandas/NumPy) instead of once per record.
+"""
+
+from typing import Dict, Any, List
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+def _is_blank(value: Any) -> bool:
+    """Match the per-record validators, which treat any falsy value as missing."""
+    return not value
+
+def _blank_mask(df: "pd.DataFrame", column: str) -> "pd.Series":
+    """Rows where a column is absent, null or empty."""
+    if column not in df.columns:
+        return pd.Series(True, index=df.index)
+    values = df[column]
+    return values.isna() | ~values.astype(bool)
+
+def validate_articles_df(articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Count missing article fields across a whole article list.
+
+    Returns the article total plus the number of articles missing a title,
+    a description (or summary) and a link (or url).
+    """
+    total = len(articles)
+    if total == 0:
+        return {"total": 0, "missing_title": 0, "missing_description": 0, "missing_link": 0}
+
+    if PANDAS_AVAILABLE:
+        df = pd.DataFrame.from_records(articles)
+        missing_title = _blank_mask(df, "title")
+        missing_description = _blank_mask(df, "description") & _blank_mask(df, "summary")
+        missing_link = _blank_mask(df, "link") & _blank_mask(df, "url")
+        return {
+            "total": total,
+            "missing_title": int(missing_title.sum()),
+            "missing_description": int(missing_description.sum()),
+            "missing_link": int(missing_link.sum())
+        }
+
+    missing_title = missing_description = missing_link = 0
+    for article in articles:
+        if _is_blank(article.get("title")):
+            missing_title += 1
+        if _is_blank(article.get("description")) and _is_blank(article.get("summary")):
+            missing_description += 1
+        if _is_blank(article.get("link")) and _is_blank(article.get("url")):
+            missing_link += 1
+    return {
+        "total": total,
+        "missing_title": missing_title,
+        "missing_description": missing_description,
+        "missing_link": missing_link
+    }
+
+def _as_float(value: Any) -> float:
+    """Coerce a value to float, mapping anything unparseable to NaN."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return float("nan")
+
+def _column(values: List[Any]) -> "np.ndarray":
+    """Convert values to a float64 array in one call, coercing item by item only if that fails."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (ValueError, TypeError):
+        return np.fromiter((_as_float(v) for v in values), dtype=np.float64, count=len(values))
+
+def validate_points_array(points: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Count out-of-range or unparseable readings across a list of geographic points.
+
+    Latitude and longitude are required on every point; temperature is only
+    checked where present, against the same range as single-point validation.
+    """
+    total = len(points)
+    if total == 0:
+        return {"total": 0, "bad_lat": 0, "bad_lon": 0, "bad_temperature": 0}
+
+    if NUMPY_AVAILABLE:
+        lats = _column([p.get("lat") for p in points])
+        lons = _column([p.get("lon") for p in points])
+        temps = _column([p.get("temperature") or p.get("temp_c") for p in points])
+        with np.errstate(invalid="ignore"):
+            bad_lat = np.isnan(lats) | (lats < -90) | (lats > 90)
+            bad_lon = np.isnan(lons) | (lons < -180) | (lons > 180)
+            bad_temperature = (temps < -100) | (temps > 60)
+        return {
+            "total": total,
+            "bad_lat": int(np.count_nonzero(bad_lat)),
+            "bad_lon": int(np.count_nonzero(bad_lon)),
+            "bad_temperature": int(np.count_nonzero(bad_temperature))
+        }
+
+    bad_lat = bad_lon = bad_temperature = 0
+    for point in points:
+        lat = _as_float(point.get("lat"))
+        lon = _as_float(point.get("lon"))
+        temp = _as_float(point.get("temperature") or point.get("temp_c"))
+        if not -90 <= lat <= 90:
+            bad_lat += 1
+        if not -180 <= lon <= 180:
+            bad_lon += 1
+        if temp < -100 or temp > 60:
+            bad_temperature += 1
+    return {
+        "total": total,
+        "bad_lat": bad_lat,
+        "bad_lon": bad_lon,
+        "bad_temperature": bad_temperature
+    }
@@ -4,9 +4,11 @@ Includes circuit breakers, retry logic, and fallback mechanisms.
 """
 
 import asyncio
+import random
 import time
 from typing import Any, Dict, Optional, Callable, List
 from datetime import datetime, timedelta
+from collections import OrderedDict
 from enum import Enum
 from functools import wraps
 
@@ -20,6 +22,15 @@ class CircuitState(Enum):
     OPEN = "open"          # Blocking requests
     HALF_OPEN = "half_open"  # Testing if service recovered
 
+# Module-level aliases avoid an Enum attribute lookup on every guarded call
+_CLOSED = CircuitState.CLOSED
+_OPEN = CircuitState.OPEN
+_HALF_OPEN = CircuitState.HALF_OPEN
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because its circuit breaker is open."""
+    pass
+
 class CircuitBreaker:
     """
     Circuit breaker pattern implementation for API resilience.
@@ -36,51 +47,55 @@ class CircuitBreaker:
         self.expected_exception = expected_exception
         
         self.failure_count = 0
-        self.last_failure_time = None
-        self.state = CircuitState.CLOSED
+        self.last_failure_time = None  # time.monotonic() seconds of the last failure
+        self.state = _CLOSED
+        
+    async def __call__(self, func: Callable, *args, **kwargs) -> Any:
+        """Invoke an async function through the circuit breaker without decorating it."""
+        if self.state is _OPEN:
+            if self._should_attempt_reset():
+                self.state = _HALF_OPEN
+                logger.info("Circuit breaker half-open, attempting reset")
+            else:
+                raise CircuitOpenError("Circuit breaker is OPEN - service unavailable")
+        
+        try:
+            result = await func(*args, **kwargs)
+        except self.expected_exception:
+            self._on_failure()
+            raise
         
+        self._on_success()
+        return result
+    
     def call(self, func: Callable):
         """Decorator to apply circuit breaker to a function."""
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            if self.state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self.state = CircuitState.HALF_OPEN
-                    logger.info("Circuit breaker half-open, attempting reset")
-                else:
-                    raise Exception("Circuit breaker is OPEN - service unavailable")
-            
-            try:
-                result = await func(*args, **kwargs)
-                self._on_success()
-                return result
-                
-            except self.expected_exception as e:
-                self._on_failure()
-                raise e
+            return await self(func, *args, **kwargs)
         
         return wrapper
     
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
         return (
-            self.last_failure_time and
-            time.time() - self.last_failure_time >= self.recovery_timeout
+            self.last_failure_time is not None and
+            time.monotonic() - self.last_failure_time >= self.recovery_timeout
         )
     
     def _on_success(self):
         """Handle successful request."""
         self.failure_count = 0
-        self.state = CircuitState.CLOSED
+        self.state = _CLOSED
         logger.debug("Circuit breaker reset to CLOSED")
     
     def _on_failure(self):
         """Handle failed request."""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
         
         if self.failure_count >= self.failure_threshold:
-            self.state = CircuitState.OPEN
+            self.state = _OPEN
             logger.warning("Circuit breaker OPEN", 
                          failure_count=self.failure_count,
                          threshold=self.failure_threshold)
@@ -103,6 +118,12 @@ class RetryPolicy:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        
+        # Backoff delay (before jitter) after each failed attempt except the last
+        self._delays = tuple(
+            min(base_delay * (exponential_base ** attempt), max_delay)
+            for attempt in range(max(0, max_attempts - 1))
+        )
     
     def retry(self, exceptions: tuple = (Exception,)):
         """Decorator to apply retry policy to a function."""
@@ -110,6 +131,8 @@ class RetryPolicy:
             @wraps(func)
             async def wrapper(*args, **kwargs):
                 last_exception = None
+                delays = self._delays
+                rand = random.random
                 
                 for attempt in range(self.max_attempts):
                     try:
@@ -126,15 +149,11 @@ class RetryPolicy:
                                        error=str(e))
                             raise e
                         
-                        # Calculate delay for next attempt
-                        delay = min(
-                            self.base_delay * (self.exponential_base ** attempt),
-                            self.max_delay
-                        )
+                        # Look up delay for next attempt
+                        delay = delays[attempt]
                         
                         if self.jitter:
-                            import random
-                            delay *= (0.5 + random.random() * 0.5)  # Add jitter
+                            delay *= (0.5 + rand() * 0.5)  # Add jitter
                         
                         logger.warning("Retry attempt failed, retrying", 
                                      function=func.__name__,
@@ -207,23 +226,42 @@ class HealthChecker:
     Health checking for external services.
     """
     
-    def __init__(self):
-        self.service_health: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, max_services: int = 256):
+        self.max_services = max_services
+        # Most recently checked services last; oldest are evicted beyond max_services
+        self.service_health: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # time.monotonic() at which each service was last checked
+        self._checked_at: Dict[str, float] = {}
+        # Number of entries in service_health currently marked healthy
+        self._healthy_count = 0
     
     async def check_service_health(
         self,
         service_name: str,
-        health_check_func: Callable
+        health_check_func: Callable,
+        ttl: float = 0.0
     ) -> Dict[str, Any]:
-        """Check health of a service."""
-        start_time = time.time()
+        """
+        Check health of a service, optionally reusing a result younger than ttl seconds.
+        
+        Args:
+            service_name: Name of the service
+            health_check_func: Async function that raises if the service is unhealthy
+            ttl: Seconds a previous result stays valid; the default 0 always checks afresh
+        """
+        start_time = time.monotonic()
+        
+        cached = self.service_health.get(service_name)
+        if cached is not None and start_time - self._checked_at[service_name] < ttl:
+            self.service_health.move_to_end(service_name)
+            return cached
         
         try:
             await health_check_func()
             
             health_data = {
                 "status": "healthy",
-                "response_time": time.time() - start_time,
+                "response_time": time.monotonic() - start_time,
                 "last_check": datetime.now().isoformat(),
                 "error": None
             }
@@ -231,12 +269,26 @@ class HealthChecker:
         except Exception as e:
             health_data = {
                 "status": "unhealthy",
-                "response_time": time.time() - start_time,
+                "response_time": time.monotonic() - start_time,
                 "last_check": datetime.now().isoformat(),
                 "error": str(e)
             }
         
+        if cached is not None and cached["status"] == "healthy":
+            self._healthy_count -= 1
+        if health_data["status"] == "healthy":
+            self._healthy_count += 1
+        
         self.service_health[service_name] = health_data
+        self.service_health.move_to_end(service_name)
+        self._checked_at[service_name] = start_time
+        
+        while len(self.service_health) > self.max_services:
+            evicted, evicted_health = self.service_health.popitem(last=False)
+            self._checked_at.pop(evicted, None)
+            if evicted_health["status"] == "healthy":
+                self._healthy_count -= 1
+        
         return health_data
     
     def get_overall_health(self) -> Dict[str, Any]:
@@ -244,11 +296,7 @@ class HealthChecker:
         if not self.service_health:
             return {"status": "unknown", "services": {}}
         
-        healthy_services = sum(
-            1 for health in self.service_health.values()
-            if health["status"] == "healthy"
-        )
-        
+        healthy_services = self._healthy_count
         total_services = len(self.service_health)
         health_percentage = (healthy_services / total_services) * 100
         
@@ -4,26 +4,136 @@ Supports WebSocket connections and live data feeds.
 """
 
 import asyncio
+import hashlib
+import inspect
 import json
-from typing import Dict, Any, Optional, Callable, Set
+import time
+from typing import Dict, Any, Optional, Callable, Set, Union
 from datetime import datetime
 import weakref
 
 import structlog
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
+# Python 3.12+ can start a task eagerly, running it up to its first real suspension inline
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+def _create_task(coro, loop: Optional[asyncio.AbstractEventLoop] = None) -> asyncio.Task:
+    """Create a task on loop (default: the running loop), starting it eagerly where supported."""
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    if _eager_task_factory is None:
+        return loop.create_task(coro)
+    return _eager_task_factory(loop, coro)
+
+def _is_async_callable(callback: Callable) -> bool:
+    """Whether calling callback returns a coroutine, including objects with an async __call__."""
+    return asyncio.iscoroutinefunction(callback) or asyncio.iscoroutinefunction(
+        getattr(callback, "__call__", None)
+    )
+
+# Payload fields that change on every fetch and so are ignored for change detection
+_VOLATILE_FIELDS = frozenset(("timestamp", "timestamp_ns"))
+
+def _dumps(data: Dict[str, Any], sort_keys: bool = False) -> bytes:
+    """Serialize a payload to JSON bytes, using orjson when installed and able to encode it."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+        except TypeError:
+            pass  # e.g. non-string keys, which stdlib json coerces
+    return json.dumps(data, sort_keys=sort_keys, default=str).encode()
+
+def _content_hash(data: Dict[str, Any]) -> bytes:
+    """Short digest of a payload's content, ignoring per-fetch timestamps."""
+    content = {k: v for k, v in data.items() if k not in _VOLATILE_FIELDS}
+    return hashlib.blake2b(_dumps(content, sort_keys=True), digest_size=8).digest()
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    """Serialize a payload once for subscribers that forward raw JSON."""
+    return _dumps(data)
+
+def _accepts_encoded(callback: Callable) -> bool:
+    """Whether a callback takes the pre-serialized payload as an `encoded` keyword argument."""
+    try:
+        parameters = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        (p.name == "encoded" and p.kind is not p.POSITIONAL_ONLY) or p.kind is p.VAR_KEYWORD
+        for p in parameters
+    )
+
+def _subscriber_ref(callback: Callable, on_dead: Optional[Callable] = None) -> Union[weakref.ref, Callable]:
+    """Weak reference to a subscriber, or the callback itself if it cannot be weakly referenced."""
+    try:
+        if inspect.ismethod(callback):
+            return weakref.WeakMethod(callback, on_dead)
+        return weakref.ref(callback, on_dead)
+    except TypeError:
+        return callback
+
+def _deref(entry: Union[weakref.ref, Callable]) -> Optional[Callable]:
+    """Resolve a stored subscriber entry, returning None once it has been collected."""
+    return entry() if isinstance(entry, weakref.ref) else entry
+
 class DataStream:
     """Manages real-time data streaming for specific data sources."""
     
+    __slots__ = (
+        "stream_id", "data_source", "update_interval", "is_active",
+        "_sync_subscribers", "_async_subscribers", "_encoded_subscribers",
+        "last_data", "_last_hash", "task", "_loop", "_outbox", "_drain_task", "_fetch",
+        "_timer", "_next_tick"
+    )
+    
+    # Data source -> fetcher method name, resolved once per stream instead of per tick
+    _FETCHERS = {
+        "financial": "_fetch_placeholder",
+        "geographic": "_fetch_placeholder",
+        "scientific": "_fetch_placeholder",
+        "news": "_fetch_placeholder"
+    }
+    
+    # Updates waiting for subscribers beyond this are dropped, oldest first
+    OUTBOX_SIZE = 16
+    # Seconds stop() waits for cancelled tasks to unwind
+    STOP_TIMEOUT = 1.0
+    # Sync subscribers called between yields to the event loop during a notification
+    NOTIFY_BATCH = 64
+    # Seconds to wait before fetching again after a failed fetch
+    RETRY_DELAY = 5
+    
     def __init__(self, stream_id: str, data_source: str, update_interval: int = 30):
         self.stream_id = stream_id
         self.data_source = data_source
         self.update_interval = update_interval
+        self._fetch = getattr(self, self._FETCHERS.get(data_source, "_fetch_placeholder"))
         self.is_active = False
-        self.subscribers: Set[Callable] = set()
+        # Subscribers split by kind at subscribe time so notification needs no per-call checks.
+        # Entries are the callbacks themselves, or weak references for subscribe(weak=True).
+        self._sync_subscribers: Set[Union[weakref.ref, Callable]] = set()
+        self._async_subscribers: Set[Union[weakref.ref, Callable]] = set()
+        # Entries whose callbacks also take the payload pre-serialized as `encoded`
+        self._encoded_subscribers: Set[Union[weakref.ref, Callable]] = set()
         self.last_data = None
+        self._last_hash: Optional[bytes] = None
+        # Fetch currently in flight; between ticks only the timer handle is held
         self.task: Optional[asyncio.Task] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._next_tick = 0.0
+        # Event loop the stream runs on, bound by start()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Updates handed from fetches to the notification task, created by start()
+        self._outbox: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
         
     async def start(self):
         """Start the data stream."""
@@ -31,78 +141,209 @@ class DataStream:
             return
             
         self.is_active = True
-        self.task = asyncio.create_task(self._stream_loop())
+        self._loop = asyncio.get_running_loop()
+        self._outbox = asyncio.Queue(maxsize=self.OUTBOX_SIZE)
+        self._drain_task = _create_task(self._drain_loop(), self._loop)
+        self._next_tick = self._loop.time()
+        self._tick()
         logger.info("Data stream started", stream_id=self.stream_id, source=self.data_source)
     
     async def stop(self):
-        """Stop the data stream."""
+        """Stop the data stream, waiting briefly for its tasks to finish cancelling."""
         self.is_active = False
-        if self.task:
-            self.task.cancel()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        tasks = [task for task in (self.task, self._drain_task) if task is not None]
+        self.task = self._drain_task = None
+        for task in tasks:
+            task.cancel()
+        
+        # A subscriber may stop the stream from inside the drain task; never wait on ourselves
+        current = asyncio.current_task()
+        pending = [task for task in tasks if task is not current and not task.done()]
+        if pending:
+            await asyncio.wait(pending, timeout=self.STOP_TIMEOUT)
         logger.info("Data stream stopped", stream_id=self.stream_id)
     
-    def subscribe(self, callback: Callable[[Dict[str, Any]], None]):
-        """Subscribe to stream updates."""
-        self.subscribers.add(callback)
+    @property
+    def subscribers(self) -> Set[Callable]:
+        """All live subscribers, sync and async."""
+        callbacks = set()
+        for entry in self._sync_subscribers | self._async_subscribers:
+            callback = _deref(entry)
+            if callback is not None:
+                callbacks.add(callback)
+        return callbacks
+    
+    @property
+    def subscriber_count(self) -> int:
+        """Number of subscribers, without resolving their references."""
+        return len(self._sync_subscribers) + len(self._async_subscribers)
+    
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None], weak: bool = False):
+        """
+        Subscribe to stream updates.
+        
+        Callbacks accepting an `encoded` keyword also receive the payload as JSON bytes,
+        serialized once per update for all such subscribers.
+        
+        Args:
+            callback: Sync or async callable receiving each update
+            weak: Hold the callback weakly, so it drops out once its owner is collected
+                instead of keeping it alive; the caller must keep a reference meanwhile
+        """
+        is_async = _is_async_callable(callback)
+        wants_encoded = _accepts_encoded(callback)
+        entry = _subscriber_ref(callback, self._discard_entry) if weak else callback
+        (self._async_subscribers if is_async else self._sync_subscribers).add(entry)
+        if wants_encoded:
+            self._encoded_subscribers.add(entry)
         
         # Send last data immediately if available
         if self.last_data:
             try:
-                callback(self.last_data)
+                kwargs = {"encoded": _encode(self.last_data)} if wants_encoded else {}
+                if is_async:
+                    _create_task(callback(self.last_data, **kwargs), self._loop if self.is_active else None)
+                else:
+                    callback(self.last_data, **kwargs)
             except Exception as e:
                 logger.warning("Subscriber callback failed", error=str(e))
     
     def unsubscribe(self, callback: Callable):
-        """Unsubscribe from stream updates."""
-        self.subscribers.discard(callback)
+        """Unsubscribe from stream updates, whether subscribed strongly or weakly."""
+        self._discard_entry(callback)
+        self._discard_entry(_subscriber_ref(callback))
     
-    async def _stream_loop(self):
-        """Main streaming loop."""
-        while self.is_active:
-            try:
-                # Fetch fresh data based on source type
-                new_data = await self._fetch_data()
-                
-                if new_data and new_data != self.last_data:
+    def _discard_entry(self, entry: Union[weakref.ref, Callable]):
+        """Forget a subscriber entry, whether unsubscribed, failed or collected."""
+        self._sync_subscribers.discard(entry)
+        self._async_subscribers.discard(entry)
+        self._encoded_subscribers.discard(entry)
+    
+    def _tick(self):
+        """Timer callback: start one fetch; the next tick is scheduled when it finishes."""
+        self._timer = None
+        if self.is_active:
+            self.task = _create_task(self._fetch_and_publish(), self._loop)
+    
+    async def _fetch_and_publish(self):
+        """Fetch once, queue the result if its content changed, and schedule the next tick."""
+        loop = self._loop
+        try:
+            # Fetch fresh data based on source type
+            new_data = await self._fetch_data()
+            
+            if new_data:
+                new_hash = _content_hash(new_data)
+                if new_hash != self._last_hash:
                     self.last_data = new_data
-                    await self._notify_subscribers(new_data)
-                
-                await asyncio.sleep(self.update_interval)
-                
-            except asyncio.CancelledError:
-                break
+                    self._last_hash = new_hash
+                    self._publish(new_data)
+            
+            # Fixed deadlines keep fetch time from adding drift; ticks missed
+            # during a slow fetch coalesce into one instead of bursting to catch up
+            self._next_tick = max(self._next_tick + self.update_interval, loop.time())
+        except Exception as e:
+            logger.error("Stream loop error", stream_id=self.stream_id, error=str(e))
+            self._next_tick = loop.time() + self.RETRY_DELAY  # Brief pause before retry
+        
+        if self.is_active:
+            self._timer = loop.call_at(self._next_tick, self._tick)
+    
+    def _publish(self, data: Dict[str, Any]):
+        """Queue an update for the notification task without waiting on subscribers."""
+        outbox = self._outbox
+        if outbox.full():
+            outbox.get_nowait()
+            logger.warning("Stream outbox full, dropping oldest update", stream_id=self.stream_id)
+        outbox.put_nowait(data)
+    
+    async def _drain_loop(self):
+        """Deliver queued updates to subscribers so slow subscribers never delay fetching."""
+        outbox = self._outbox
+        while True:
+            data = await outbox.get()
+            try:
+                await self._notify_subscribers(data)
             except Exception as e:
-                logger.error("Stream loop error", stream_id=self.stream_id, error=str(e))
-                await asyncio.sleep(5)  # Brief pause before retry
+                logger.error("Stream notification error", stream_id=self.stream_id, error=str(e))
     
     async def _fetch_data(self) -> Optional[Dict[str, Any]]:
-        """Fetch fresh data for this stream."""
-        # This would be implemented based on the specific data source
-        # For now, return a placeholder
+        """Fetch fresh data for this stream using the fetcher bound to its source."""
+        return await self._fetch()
+    
+    async def _fetch_placeholder(self) -> Optional[Dict[str, Any]]:
+        """Placeholder fetcher until a source-specific implementation is registered."""
         return {
             "stream_id": self.stream_id,
             "source": self.data_source,
-            "timestamp": datetime.now().isoformat(),
+            # Formatted only when read by get_stream_status
+            "timestamp_ns": time.time_ns(),
             "data": f"Live data from {self.data_source}"
         }
     
-    async def _notify_subscribers(self, data: Dict[str, Any]):
-        """Notify all subscribers of new data."""
-        failed_callbacks = []
+    async def _notify_subscribers(self, data: Dict[str, Any], encoded: Optional[bytes] = None):
+        """
+        Notify all subscribers of new data, running async subscribers concurrently.
+        
+        The payload is serialized at most once, and only if a subscriber wants the bytes.
+        """
+        failed_entries = set()
+        encoded_subscribers = self._encoded_subscribers
+        if encoded is None and encoded_subscribers:
+            encoded = _encode(data)
         
-        for callback in self.subscribers:
+        # Iterate over copies: collected subscribers remove themselves from the sets
+        for i, entry in enumerate(list(self._sync_subscribers), 1):
+            if i % self.NOTIFY_BATCH == 0:
+                # Let other streams run between bursts of callbacks
+                await asyncio.sleep(0)
+            callback = _deref(entry)
+            if callback is None:
+                continue
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(data)
+                if entry in encoded_subscribers:
+                    callback(data, encoded=encoded)
                 else:
                     callback(data)
             except Exception as e:
                 logger.warning("Subscriber notification failed", error=str(e))
-                failed_callbacks.append(callback)
+                failed_entries.add(entry)
+        
+        async_entries = []
+        coroutines = []
+        for entry in list(self._async_subscribers):
+            callback = _deref(entry)
+            if callback is not None:
+                async_entries.append(entry)
+                if entry in encoded_subscribers:
+                    coroutines.append(callback(data, encoded=encoded))
+                else:
+                    coroutines.append(callback(data))
+        
+        if coroutines:
+            results = await asyncio.gather(*coroutines, return_exceptions=True)
+            for entry, result in zip(async_entries, results):
+                if isinstance(result, Exception):
+                    logger.warning("Subscriber notification failed", error=str(result))
+                    failed_entries.add(entry)
         
-        # Remove failed callbacks
-        for callback in failed_callbacks:
-            self.subscribers.discard(callback)
+        # Remove failed callbacks in one set operation per collection
+        if failed_entries:
+            self._sync_subscribers -= failed_entries
+            self._async_subscribers -= failed_entries
+            self._encoded_subscribers -= failed_entries
+
+def _format_last_update(data: Optional[Dict[str, Any]]) -> Optional[str]:
+    """ISO timestamp of a stream payload, formatting the raw nanosecond clock reading on demand."""
+    if not data:
+        return None
+    timestamp_ns = data.get("timestamp_ns")
+    if timestamp_ns is None:
+        return data.get("timestamp")
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
 
 class StreamManager:
     """Manages multiple data streams."""
@@ -175,26 +416,35 @@ class StreamManager:
         return False
     
     async def stop_all_streams(self):
-        """Stop all active streams."""
-        for stream in self.streams.values():
-            await stream.stop()
+        """Stop all active streams concurrently."""
+        streams = list(self.streams.items())
+        results = await asyncio.gather(
+            *(stream.stop() for _, stream in streams),
+            return_exceptions=True
+        )
+        for (stream_id, _), result in zip(streams, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to stop stream", stream_id=stream_id, error=str(result))
     
     def get_stream_status(self) -> Dict[str, Any]:
-        """Get status of all streams."""
+        """Get status of all streams in a single pass over them."""
+        active_streams = 0
+        streams = {}
+        for stream_id, stream in self.streams.items():
+            active_streams += stream.is_active
+            streams[stream_id] = {
+                "active": stream.is_active,
+                "subscribers": stream.subscriber_count,
+                "source": stream.data_source,
+                "interval": stream.update_interval,
+                "last_update": _format_last_update(stream.last_data)
+            }
+        
         return {
-            "active_streams": len([s for s in self.streams.values() if s.is_active]),
+            "active_streams": active_streams,
             "total_streams": len(self.streams),
-            "streams": {
-                stream_id: {
-                    "active": stream.is_active,
-                    "subscribers": len(stream.subscribers),
-                    "source": stream.data_source,
-                    "interval": stream.update_interval,
-                    "last_update": stream.last_data.get("timestamp") if stream.last_data else None
-                }
-                for stream_id, stream in self.streams.items()
-            },
-            "available_streams": list(self.stream_configs.keys())
+            "streams": streams,
+            "available_streams": list(self.stream_configs)
         }
 
 # Global stream manager instance
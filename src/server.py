@@ -8,12 +8,15 @@ financial markets, news sources, and more.
 """
 
 import asyncio
+import functools
+import gc
+import inspect
 import json
 import logging
 import sys
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from datetime import date, datetime, time as datetime_time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Set proper encoding for Windows console
 if sys.platform == "win32":
@@ -21,7 +24,9 @@ if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+import httpx
 import structlog
+from cachetools import TTLCache
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
@@ -35,28 +40,44 @@ from adapters.geographic import GeographicDataAdapter
 from adapters.technology import TechnologyDataAdapter
 from core.cache import CacheManager
 from core.config import Config
+from core.preheat import Preheater
+from core.resilience import CircuitBreaker, CircuitOpenError, CircuitState
+
+# Use orjson for faster response serialization when installed
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+# Use uvloop's faster event loop when installed (not available on Windows)
+try:
+    import uvloop
+    uvloop_available = True
+except ImportError:
+    uvloop_available = False
+
+# HTTP/2 for the shared adapter client needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    http2_available = True
+except ImportError:
+    http2_available = False
+
+# Compiled argument validation; without it the MCP SDK's own jsonschema check is used
+try:
+    import fastjsonschema
+    fastjsonschema_available = True
+except ImportError:
+    fastjsonschema_available = False
 
 # Try to import enhanced monitoring - fallback gracefully if not available
 try:
     from core.monitoring import MetricsCollector, HealthMonitor, DashboardGenerator
     monitoring_available = True
 except ImportError:
+    from core.monitoring_fallback import MetricsCollector, HealthMonitor, DashboardGenerator
     monitoring_available = False
-    # Create simple fallback classes
-    class MetricsCollector:
-        def record_request(self, api_name, duration, success): pass
-        def get_api_metrics(self): return {}
-    
-    class HealthMonitor:
-        def __init__(self, metrics_collector=None): 
-            self.metrics_collector = metrics_collector
-        async def check_health(self): return {"status": "ok"}
-    
-    class DashboardGenerator:
-        def __init__(self, metrics_collector, health_monitor): 
-            self.metrics = metrics_collector
-            self.health = health_monitor
-        async def generate_dashboard(self): return {"status": "monitoring not available"}
 
 # Configure logging to stderr for MCP compatibility  
 logging.basicConfig(
@@ -65,14 +86,79 @@ logging.basicConfig(
     stream=sys.stderr
 )
 
+# Adapters and core modules log through structlog: drop calls below INFO before any
+# processor runs, and keep output off stdout, which carries the MCP protocol
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+    logger_factory=structlog.PrintLoggerFactory(sys.stderr),
+)
+
 logger = logging.getLogger(__name__)
 
 # Create the MCP server instance
 server = Server("universal-public-data")
 
+if orjson_available:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _json_default(obj: Any) -> str:
+    """Stringify a type json can't encode, writing dates and times in ISO format as orjson does."""
+    if isinstance(obj, (date, datetime_time)):
+        return obj.isoformat()
+    return str(obj)
+
+# Stdlib encoder for the fallback path, built once rather than on every json.dumps call
+_json_encoder = json.JSONEncoder(separators=(",", ":"), default=_json_default)
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response as compact JSON, stringifying unsupported types.
+    
+    Responses are parsed by MCP clients, so indentation would only add bytes.
+    """
+    if orjson_available:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json handles these
+    return _json_encoder.encode(obj)
+
+def _arguments_key(arguments: Dict[str, Any]) -> str:
+    """Canonical string for tool arguments, equal for equal arguments in any key order."""
+    if orjson_available:
+        try:
+            return orjson.dumps(arguments, default=str, option=orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+
+class _LazyRepr:
+    """Defer repr of a log argument until a handler formats it, truncated to keep lines short."""
+    __slots__ = ("obj",)
+    
+    MAX_LENGTH = 200
+    
+    def __init__(self, obj: Any):
+        self.obj = obj
+    
+    def __repr__(self) -> str:
+        text = repr(self.obj)
+        if len(text) > self.MAX_LENGTH:
+            return text[:self.MAX_LENGTH] + "..."
+        return text
+
+def _text_content(text: str) -> types.TextContent:
+    """Wrap already-serialized JSON as tool output without re-running pydantic validation."""
+    return types.TextContent.model_construct(type="text", text=text)
+
 class UniversalPublicDataServer:
     """Main MCP server class that provides access to multiple public data sources."""
     
+    __slots__ = (
+        "config", "cache", "metrics", "health_monitor", "dashboard_generator",
+        "_adapters_initialized", "http",
+        "government", "scientific", "financial", "news", "geographic", "technology",
+    )
+    
     def __init__(self):
         """Initialize the MCP server with lazy-loaded adapters for fast startup."""
         logger.info("Starting Universal Public Data MCP Server initialization...")
@@ -93,6 +179,8 @@ class UniversalPublicDataServer:
         
         # Initialize adapters lazily (don't create HTTP clients yet)
         self._adapters_initialized = False
+        # Connection pool shared by all adapters, created with them
+        self.http: Optional[httpx.AsyncClient] = None
         self.government = None
         self.scientific = None
         self.financial = None
@@ -107,27 +195,61 @@ class UniversalPublicDataServer:
         """Initialize adapters only when first needed (lazy initialization)."""
         if not self._adapters_initialized:
             logger.info("Initializing data adapters...")
-            self.government = GovernmentDataAdapter(self.cache)
-            self.scientific = ScientificDataAdapter(self.cache)
-            self.financial = FinancialDataAdapter(self.cache)
-            self.news = NewsDataAdapter(self.cache)
-            self.geographic = GeographicDataAdapter(self.cache)
-            self.technology = TechnologyDataAdapter(self.cache)
+            self.http = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                headers={"User-Agent": "Universal-Public-Data-MCP/1.0"},
+                http2=http2_available
+            )
+            self.government = GovernmentDataAdapter(self.cache, self.http)
+            self.scientific = ScientificDataAdapter(self.cache, self.http)
+            self.financial = FinancialDataAdapter(self.cache, self.http)
+            self.news = NewsDataAdapter(self.cache, self.http)
+            self.geographic = GeographicDataAdapter(self.cache, self.http)
+            self.technology = TechnologyDataAdapter(self.cache, self.http)
             self._adapters_initialized = True
             logger.info("All data adapters initialized")
+    
+    async def aclose(self):
+        """
+        Stop the cache's background tasks and release the shared HTTP connection pool.
+        Adapters and bound tools are dropped with the client, so a later call rebuilds them.
+        """
+        await self.cache.aclose()
+        if self.http is not None:
+            await self.http.aclose()
+            self.http = None
+        self._adapters_initialized = False
+        self.government = None
+        self.scientific = None
+        self.financial = None
+        self.news = None
+        self.geographic = None
+        self.technology = None
+        _bound_tools.clear()
 
 # Create the server instance
 server_instance = UniversalPublicDataServer()
 
-# Register tools with the global server
-@server.list_tools()
-async def handle_list_tools() -> List[types.Tool]:
-    """List all available tools."""
-    logger.info("Tools list requested")
-    tools = []
+# Schema blocks repeated verbatim across tools, shared rather than rebuilt per tool.
+# Treat them as read-only.
+_LOCATION_SCHEMA = {
+    "type": "string",
+    "description": "City, state, or coordinates"
+}
+_NO_ARGUMENTS_SCHEMA = {
+    "type": "object",
+    "properties": {},
+    "required": [],
+    "additionalProperties": False
+}
+
+def _build_tools() -> Dict[str, List[types.Tool]]:
+    """Build the static tool definitions advertised by the server, grouped by category."""
+    tools: Dict[str, List[types.Tool]] = {}
     
     # Government tools
-    tools.extend([
+    tools["government"] = [
         types.Tool(
             name="get_census_data",
             description="Get demographic data from US Census Bureau",
@@ -148,7 +270,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "description": "Year for data (default: latest available)"
                     }
                 },
-                "required": ["location", "metric"]
+                "required": ["location", "metric"],
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -168,7 +291,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "enum": ["1m", "3m", "6m", "1y", "5y"]
                     }
                 },
-                "required": ["indicator"]
+                "required": ["indicator"],
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -192,13 +316,14 @@ async def handle_list_tools() -> List[types.Tool]:
                         "default": 10
                     }
                 },
-                "required": ["company"]
+                "required": ["company"],
+                "additionalProperties": False
             }
         )
-    ])
+    ]
     
     # Scientific tools
-    tools.extend([
+    tools["scientific"] = [
         types.Tool(
             name="get_nasa_data",
             description="Access NASA APIs for space and earth science data",
@@ -223,7 +348,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         }
                     }
                 },
-                "required": ["dataset"]
+                "required": ["dataset"],
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -253,7 +379,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "default": 10
                     }
                 },
-                "required": ["query"]
+                "required": ["query"],
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -262,10 +389,7 @@ async def handle_list_tools() -> List[types.Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "location": {
-                        "type": "string",
-                        "description": "City, state, or coordinates"
-                    },
+                    "location": _LOCATION_SCHEMA,
                     "metric": {
                         "type": "string",
                         "description": "Climate metric",
@@ -278,13 +402,14 @@ async def handle_list_tools() -> List[types.Tool]:
                         "default": "current"
                     }
                 },
-                "required": ["location", "metric"]
+                "required": ["location", "metric"],
+                "additionalProperties": False
             }
         )
-    ])
+    ]
     
     # Financial tools
-    tools.extend([
+    tools["financial"] = [
         types.Tool(
             name="get_stock_data",
             description="Get real-time stock data and financial metrics",
@@ -310,7 +435,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "description": "Specific metrics to return"
                     }
                 },
-                "required": ["symbol"]
+                "required": ["symbol"],
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -334,7 +460,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "default": True
                     }
                 },
-                "required": ["symbol"]
+                "required": ["symbol"],
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -357,13 +484,14 @@ async def handle_list_tools() -> List[types.Tool]:
                         "default": 1
                     }
                 },
-                "required": ["from_currency", "to_currency"]
+                "required": ["from_currency", "to_currency"],
+                "additionalProperties": False
             }
         )
-    ])
+    ]
     
     # News and media tools
-    tools.extend([
+    tools["news"] = [
         types.Tool(
             name="get_breaking_news",
             description="Get latest breaking news from multiple sources",
@@ -386,7 +514,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "description": "Language for news",
                         "default": "en"
                     }
-                }
+                },
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -416,7 +545,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "default": 15
                     }
                 },
-                "required": ["query"]
+                "required": ["query"],
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -436,23 +566,21 @@ async def handle_list_tools() -> List[types.Tool]:
                         "default": "24h"
                     }
                 },
-                "required": ["topic"]
+                "required": ["topic"],
+                "additionalProperties": False
             }
         )
-    ])
+    ]
     
     # Geographic and environmental tools
-    tools.extend([
+    tools["geographic"] = [
         types.Tool(
             name="get_weather_data",
             description="Get current weather and forecasts",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "location": {
-                        "type": "string",
-                        "description": "City, state, or coordinates"
-                    },
+                    "location": _LOCATION_SCHEMA,
                     "type": {
                         "type": "string",
                         "description": "Type of weather data",
@@ -466,7 +594,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "default": "metric"
                     }
                 },
-                "required": ["location"]
+                "required": ["location"],
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -475,10 +604,7 @@ async def handle_list_tools() -> List[types.Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "location": {
-                        "type": "string",
-                        "description": "City, state, or coordinates"
-                    },
+                    "location": _LOCATION_SCHEMA,
                     "pollutants": {
                         "type": "array",
                         "items": {
@@ -488,7 +614,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "description": "Specific pollutants to check"
                     }
                 },
-                "required": ["location"]
+                "required": ["location"],
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -510,13 +637,32 @@ async def handle_list_tools() -> List[types.Tool]:
                         "description": "Types of disasters to check for"
                     }
                 },
-                "required": ["location"]
+                "required": ["location"],
+                "additionalProperties": False
+            }
+        ),
+        types.Tool(
+            name="get_location_snapshot",
+            description="Get current weather, air quality and disaster alerts for a location in one call",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "location": _LOCATION_SCHEMA,
+                    "units": {
+                        "type": "string",
+                        "description": "Temperature units",
+                        "enum": ["metric", "imperial"],
+                        "default": "metric"
+                    }
+                },
+                "required": ["location"],
+                "additionalProperties": False
             }
         )
-    ])
+    ]
     
     # Technology tools
-    tools.extend([
+    tools["technology"] = [
         types.Tool(
             name="get_github_trends",
             description="Get trending repositories and topics on GitHub",
@@ -538,7 +684,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "description": "Number of repositories to return",
                         "default": 25
                     }
-                }
+                },
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -557,7 +704,8 @@ async def handle_list_tools() -> List[types.Tool]:
                         "default": False
                     }
                 },
-                "required": ["domain"]
+                "required": ["domain"],
+                "additionalProperties": False
             }
         ),
         types.Tool(
@@ -585,21 +733,18 @@ async def handle_list_tools() -> List[types.Tool]:
                         "default": "6m"
                     }
                 },
-                "required": ["technology"]
+                "required": ["technology"],
+                "additionalProperties": False
             }
         )
-    ])
+    ]
     
     # System monitoring tools
-    tools.extend([
+    tools["monitoring"] = [
         types.Tool(
             name="get_system_status",
             description="Get comprehensive system health and performance metrics",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
+            inputSchema=_NO_ARGUMENTS_SCHEMA,
         ),
         types.Tool(
             name="get_api_metrics",
@@ -612,189 +757,415 @@ async def handle_list_tools() -> List[types.Tool]:
                         "description": "Specific API to get metrics for (optional)"
                     }
                 },
-                "required": []
+                "required": [],
+                "additionalProperties": False
             },
         ),
         types.Tool(
             name="get_cache_stats",
             description="Get cache performance statistics and hit ratios",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
+            inputSchema=_NO_ARGUMENTS_SCHEMA,
         ),
-    ])
+    ]
     
     return tools
 
+# Tool definitions never change at runtime, so build them once at import.
+# Categories match the adapter attribute names, plus "monitoring".
+_TOOLS_BY_CATEGORY: Dict[str, Tuple[types.Tool, ...]] = {
+    category: tuple(tools) for category, tools in _build_tools().items()
+}
+_TOOLS: List[types.Tool] = [tool for tools in _TOOLS_BY_CATEGORY.values() for tool in tools]
+
+# Register tools with the global server
+@server.list_tools()
+async def handle_list_tools() -> List[types.Tool]:
+    """List all available tools."""
+    logger.info("Tools list requested")
+    return _TOOLS
+
+# Wall-clock second and its ISO string, shared by every timestamp taken within that second
+_iso_cache: List[Any] = [0, ""]
+
+def _iso_now() -> str:
+    """Current local time as an ISO string at one-second resolution."""
+    second = int(time.time())
+    if second != _iso_cache[0]:
+        _iso_cache[0] = second
+        _iso_cache[1] = datetime.fromtimestamp(second).isoformat()
+    return _iso_cache[1]
+
+# Monitoring tool handlers (these don't need adapters)
+async def _get_system_status(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return await server_instance.dashboard_generator.generate_dashboard()
+
+async def _get_api_metrics(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    api_name = arguments.get("api_name")
+    
+    if api_name:
+        api_metrics = server_instance.metrics.get_api_metrics()
+        if api_name in api_metrics:
+            result = {api_name: api_metrics[api_name]}
+        else:
+            result = {"error": f"No metrics found for API: {api_name}"}
+    else:
+        result = server_instance.metrics.get_api_metrics()
+    
+    result["timestamp"] = _iso_now()
+    return result
+
+async def _get_cache_stats(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    # Redis stats involve network round trips; fetch both figures concurrently
+    cache_stats, hit_ratio = await asyncio.gather(
+        server_instance.cache.get_cache_stats(),
+        server_instance.cache.get_hit_ratio()
+    )
+    
+    return {
+        "cache_stats": cache_stats,
+        "hit_ratio": hit_ratio,
+        "hit_ratio_percent": hit_ratio * 100,
+        "timestamp": _iso_now()
+    }
+
+# Tool name -> (handler, metrics API name)
+_MONITORING_TOOLS: Dict[str, Tuple[Callable, str]] = {
+    "get_system_status": (_get_system_status, "system_monitoring"),
+    "get_api_metrics": (_get_api_metrics, "api_metrics"),
+    "get_cache_stats": (_get_cache_stats, "cache_stats"),
+}
+
+# Seconds a serialized monitoring response is reused, so polling bursts share one computation
+_MONITORING_TTL: Dict[str, float] = {
+    "get_system_status": 2.0,
+    "get_api_metrics": 1.0,
+    "get_cache_stats": 1.0,
+}
+# (tool name, arguments key) -> (monotonic time, serialized response). Arguments are
+# client-controlled, so the cache is bounded and entries expire after the longest TTL
+_MONITORING_CACHE_SIZE = 64
+_monitoring_cache: "TTLCache[Tuple[str, str], Tuple[float, str]]" = TTLCache(
+    maxsize=_MONITORING_CACHE_SIZE, ttl=max(_MONITORING_TTL.values())
+)
+# Refreshes currently running, removed as soon as they finish
+_monitoring_refreshes: Dict[Tuple[str, str], "asyncio.Task[str]"] = {}
+
+async def _refresh_monitoring(key: Tuple[str, str], handler: Callable, arguments: Dict[str, Any]) -> str:
+    text = _dumps(await handler(arguments))
+    _monitoring_cache[key] = (time.monotonic(), text)
+    return text
+
+async def _monitoring_response(name: str, handler: Callable, arguments: Dict[str, Any]) -> str:
+    """Return the serialized monitoring response, recomputing it at most once per TTL."""
+    key = (name, _arguments_key(arguments))
+    cached = _monitoring_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _MONITORING_TTL[name]:
+        return cached[1]
+    
+    # Callers arriving during a refresh share it rather than computing their own
+    task = _monitoring_refreshes.get(key)
+    if task is None:
+        task = _monitoring_refreshes[key] = asyncio.ensure_future(_refresh_monitoring(key, handler, arguments))
+        task.add_done_callback(lambda _: _monitoring_refreshes.pop(key, None))
+    return await asyncio.shield(task)
+
+# Tool name -> (adapter attribute, adapter method, metrics API name; None records under the tool name)
+_ADAPTER_TOOLS: Dict[str, Tuple[str, str, Optional[str]]] = {
+    # Government data tools
+    "get_census_data": ("government", "get_census_data", None),
+    "get_economic_indicators": ("government", "get_economic_indicators", None),
+    "search_sec_filings": ("government", "search_sec_filings", None),
+    # Scientific data tools
+    "get_nasa_data": ("scientific", "get_nasa_data", "nasa"),
+    "search_research_papers": ("scientific", "search_research_papers", None),
+    "get_climate_data": ("scientific", "get_climate_data", None),
+    # Financial tools
+    "get_stock_data": ("financial", "get_stock_data", None),
+    "get_crypto_data": ("financial", "get_crypto_data", None),
+    "get_exchange_rates": ("financial", "get_exchange_rates", None),
+    # News and media tools
+    "get_breaking_news": ("news", "get_breaking_news", None),
+    "search_news": ("news", "search_news", None),
+    "analyze_media_sentiment": ("news", "analyze_media_sentiment", None),
+    # Geographic tools
+    "get_weather_data": ("geographic", "get_weather_data", None),
+    "get_air_quality": ("geographic", "get_air_quality", None),
+    "get_disaster_alerts": ("geographic", "get_disaster_alerts", None),
+    "get_location_snapshot": ("geographic", "get_location_snapshot", None),
+    # Technology tools
+    "get_github_trends": ("technology", "get_github_trends", None),
+    "get_domain_info": ("technology", "get_domain_info", None),
+    "analyze_tech_trends": ("technology", "analyze_tech_trends", None),
+}
+
+# Maximum concurrent calls per adapter, kept below the upstream APIs' rate limits
+_ADAPTER_CONCURRENCY: Dict[str, int] = {
+    "government": 8,
+    "scientific": 16,
+    "financial": 16,
+    "news": 8,
+    "geographic": 16,
+    "technology": 8,
+}
+
+# Upper bound on one adapter call; adapters may make several upstream requests,
+# each already limited by the shared client's 30s timeout
+_TOOL_TIMEOUT = 60.0
+
+# Consecutive timeouts before a tool's circuit opens, and seconds before retrying it
+_BREAKER_THRESHOLD = 5
+_BREAKER_RECOVERY = 30
+
+# Failures the dispatcher expects under upstream trouble; logged without a traceback
+_EXPECTED_FAILURES = (asyncio.TimeoutError, CircuitOpenError)
+
+# Failures that count towards opening a tool's circuit. Only timeouts: adapters catch
+# upstream errors themselves and report them in the result, where a dead upstream
+# can't be told apart from a client's bad request, so a fast-failing upstream never
+# trips the breaker. Counting error results would let one client block a tool for all.
+_BREAKER_FAILURES = (asyncio.TimeoutError,)
+
+# Tool name -> (bound adapter method, adapter semaphore, metrics name, circuit breaker),
+# filled once adapters exist so calls skip the server_instance attribute chain
+_bound_tools: Dict[str, Tuple[Callable, asyncio.Semaphore, str, CircuitBreaker]] = {}
+
+async def _call_with_timeout(method: Callable, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Await an adapter method, failing with a descriptive error after _TOOL_TIMEOUT."""
+    try:
+        return await asyncio.wait_for(method(**arguments), _TOOL_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise asyncio.TimeoutError(f"Tool call timed out after {_TOOL_TIMEOUT:.0f}s") from None
+
+def _bind_adapter_tools():
+    """Initialize adapters and bind every adapter tool to its method, semaphore and breaker.
+    
+    Must run inside the event loop, which the semaphores attach to on older Pythons.
+    """
+    server_instance._ensure_adapters_initialized()
+    semaphores = {
+        adapter_attr: asyncio.Semaphore(limit)
+        for adapter_attr, limit in _ADAPTER_CONCURRENCY.items()
+    }
+    for tool_name, (adapter_attr, method_name, api_name) in _ADAPTER_TOOLS.items():
+        method = getattr(getattr(server_instance, adapter_attr), method_name)
+        breaker = CircuitBreaker(
+            failure_threshold=_BREAKER_THRESHOLD,
+            recovery_timeout=_BREAKER_RECOVERY,
+            expected_exception=_BREAKER_FAILURES
+        )
+        _bound_tools[tool_name] = (method, semaphores[adapter_attr], api_name or tool_name, breaker)
+
+# Validate arguments with compiled validators at the dispatch boundary, before any
+# cache or network work. Newer SDKs run their own interpreted jsonschema check on
+# every call, which is switched off in favour of this one; older SDKs validate nothing.
+_validate_arguments = fastjsonschema_available
+_call_tool_options: Dict[str, Any] = (
+    {"validate_input": False}
+    if _validate_arguments and "validate_input" in inspect.signature(server.call_tool).parameters
+    else {}
+)
+
+# Tool name -> compiled argument validator, compiled on first call of each tool
+_validators: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+_SCHEMAS: Dict[str, Dict[str, Any]] = {tool.name: tool.inputSchema for tool in _TOOLS}
+
+class InvalidArgumentsError(ValueError):
+    """Raised when a tool call's arguments don't match the tool's input schema."""
+    pass
+
+def _validate_tool_arguments(name: str, arguments: Dict[str, Any]):
+    """Check arguments against the tool's input schema, raising InvalidArgumentsError if they don't match."""
+    validator = _validators.get(name)
+    if validator is None:
+        schema = _SCHEMAS.get(name)
+        if schema is None:
+            return
+        # use_default=False: validation must not write schema defaults into the caller's arguments
+        validator = _validators[name] = fastjsonschema.compile(schema, use_default=False)
+    try:
+        validator(arguments)
+    except fastjsonschema.JsonSchemaException as e:
+        raise InvalidArgumentsError(f"Input validation error: {e.message}") from None
+
+@functools.lru_cache(maxsize=64)
+def _unknown_tool_response(name: str) -> str:
+    """Serialized error for an unknown tool name, reused for repeated requests."""
+    return _dumps({
+        "error": f"Unknown tool: {name}",
+        "tool": name
+    })
+
+# Adapter calls currently running, keyed by tool name and arguments
+_inflight: Dict[Tuple[str, str], "asyncio.Task[List[types.TextContent]]"] = {}
+
+def _start_call(key: Tuple[str, str], arguments: Dict[str, Any], refill: bool = False) -> "asyncio.Task[List[types.TextContent]]":
+    """Run an adapter call as a task that identical calls can join until it finishes."""
+    task = _inflight[key] = asyncio.ensure_future(_call_tool(key[0], arguments, key, refill))
+    task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return task
+
+async def _refill(call: Tuple[Tuple[str, str], Dict[str, Any]]):
+    """Re-run a frequently repeated adapter call so the adapter refreshes its cached result.
+    
+    A call whose result is still cached costs one cache lookup; an expired one is
+    fetched here instead of on a user's request. Users calling meanwhile join the refill.
+    """
+    key, arguments = call
+    bound = _bound_tools.get(key[0])
+    # Leave tools alone while their upstream is failing
+    if bound is None or key in _inflight or bound[3].state is not CircuitState.CLOSED:
+        return
+    # Shield so a cancelled preheat round does not cancel the call for joined users
+    await asyncio.shield(_start_call(key, arguments, refill=True))
+
+# Recurring adapter calls, refilled in the background every 30 seconds. Opt-in, since
+# refills spend the quota of rate-limited upstreams
+_preheat_enabled = server_instance.config.cache.preheat_enabled
+_preheater = Preheater(_refill)
+
 # Tool implementation
-@server.call_tool()
+@server.call_tool(**_call_tool_options)
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
-    """Handle tool calls by routing to appropriate adapters."""
-    start_time = time.time()
+    """Handle tool calls, letting identical concurrent adapter calls share one request."""
+    # Monitoring tools have their own TTL cache, and unknown tools fail immediately
+    if name not in _ADAPTER_TOOLS:
+        return await _call_tool(name, arguments)
+    
+    key = (name, _arguments_key(arguments))
+    task = _inflight.get(key)
+    if task is None:
+        task = _start_call(key, arguments)
+    # Shield so one caller being cancelled does not cancel the call for the others
+    return await asyncio.shield(task)
+
+async def _call_tool(
+    name: str,
+    arguments: Dict[str, Any],
+    key: Optional[Tuple[str, str]] = None,
+    refill: bool = False
+) -> List[types.TextContent]:
+    """Route a tool call to its monitoring handler or adapter.
+    
+    key is the call's coalescing key, given for adapter calls. Preheat refills bypass
+    the breaker and metrics, so failures no user saw never count against a tool.
+    """
+    now = time.perf_counter_ns
+    start_ns = now()
+    # Metrics name and outcome, recorded once in the finally block
+    metric_name = name
+    success = False
     
     try:
-        logger.info(f"Tool called: {name} with args: {arguments}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Tool called: %s with args: %r", name, _LazyRepr(arguments))
         
-        # Ensure adapters are initialized before first use (lazy loading)
-        server_instance._ensure_adapters_initialized()
+        if _validate_arguments:
+            _validate_tool_arguments(name, arguments)
         
-        result = None
+        monitoring_tool = _MONITORING_TOOLS.get(name)
+        if monitoring_tool is not None:
+            handler, metric_name = monitoring_tool
+            text = await _monitoring_response(name, handler, arguments)
+            success = True
+            return [_text_content(text)]
         
-        # Route monitoring tools (these don't need adapters)
-        if name == "get_system_status":
-            dashboard_data = await server_instance.dashboard_generator.generate_dashboard()
-            server_instance.metrics.record_request("system_monitoring", time.time() - start_time, True)
-            
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(dashboard_data, indent=2, default=str)
-            )]
+        bound = _bound_tools.get(name)
+        if bound is None:
+            if name not in _ADAPTER_TOOLS:
+                # A client mistake rather than a server fault: no traceback needed
+                logger.warning("Unknown tool requested: %s", name)
+                return [_text_content(_unknown_tool_response(name))]
+            # Ensure adapters are initialized before first use (lazy loading)
+            _bind_adapter_tools()
+            bound = _bound_tools[name]
         
-        elif name == "get_api_metrics":
-            api_name = arguments.get("api_name")
-            
-            if api_name:
-                api_metrics = server_instance.metrics.get_api_metrics()
-                if api_name in api_metrics:
-                    result = {api_name: api_metrics[api_name]}
-                else:
-                    result = {"error": f"No metrics found for API: {api_name}"}
+        method, semaphore, metric_name, breaker = bound
+        async with semaphore:
+            # Adapters report upstream errors in the result; the breaker trips on
+            # timeouts, failing fast while a tool keeps hanging
+            if refill:
+                result = await _call_with_timeout(method, arguments)
             else:
-                result = server_instance.metrics.get_api_metrics()
-            
-            result["timestamp"] = datetime.now().isoformat()
-            server_instance.metrics.record_request("api_metrics", time.time() - start_time, True)
-            
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(result, indent=2, default=str)
-            )]
-        
-        elif name == "get_cache_stats":
-            cache_stats = await server_instance.cache.get_cache_stats()
-            hit_ratio = await server_instance.cache.get_hit_ratio()
-            
-            result = {
-                "cache_stats": cache_stats,
-                "hit_ratio": hit_ratio,
-                "hit_ratio_percent": hit_ratio * 100,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            server_instance.metrics.record_request("cache_stats", time.time() - start_time, True)
-            
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(result, indent=2, default=str)
-            )]
-        
-        # Government data tools
-        if name == "get_census_data":
-            result = await server_instance.government.get_census_data(**arguments)
-        elif name == "get_economic_indicators":
-            result = await server_instance.government.get_economic_indicators(**arguments)
-        elif name == "search_sec_filings":
-            result = await server_instance.government.search_sec_filings(**arguments)
-        
-        # Scientific data tools
-        elif name == "get_nasa_data":
-            result = await server_instance.scientific.get_nasa_data(**arguments)
-            server_instance.metrics.record_request("nasa", time.time() - start_time, "error" not in result)
-        elif name == "search_research_papers":
-            result = await server_instance.scientific.search_research_papers(**arguments)
-        elif name == "get_climate_data":
-            result = await server_instance.scientific.get_climate_data(**arguments)
-        
-        # Financial tools
-        elif name == "get_stock_data":
-            result = await server_instance.financial.get_stock_data(**arguments)
-        elif name == "get_crypto_data":
-            result = await server_instance.financial.get_crypto_data(**arguments)
-        elif name == "get_exchange_rates":
-            result = await server_instance.financial.get_exchange_rates(**arguments)
+                result = await breaker(_call_with_timeout, method, arguments)
+        success = "error" not in result
+        if success and _preheat_enabled and not refill and key is not None:
+            _preheater.record(key, (key, arguments))
         
-        # News and media tools
-        elif name == "get_breaking_news":
-            result = await server_instance.news.get_breaking_news(**arguments)
-        elif name == "search_news":
-            result = await server_instance.news.search_news(**arguments)
-        elif name == "analyze_media_sentiment":
-            result = await server_instance.news.analyze_media_sentiment(**arguments)
-        
-        # Geographic tools
-        elif name == "get_weather_data":
-            result = await server_instance.geographic.get_weather_data(**arguments)
-        elif name == "get_air_quality":
-            result = await server_instance.geographic.get_air_quality(**arguments)
-        elif name == "get_disaster_alerts":
-            result = await server_instance.geographic.get_disaster_alerts(**arguments)
-        
-        # Technology tools
-        elif name == "get_github_trends":
-            result = await server_instance.technology.get_github_trends(**arguments)
-        elif name == "get_domain_info":
-            result = await server_instance.technology.get_domain_info(**arguments)
-        elif name == "analyze_tech_trends":
-            result = await server_instance.technology.analyze_tech_trends(**arguments)
-        
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-        
-        logger.info(f"Tool {name} completed successfully")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tool %s completed in %.1f ms", name, (now() - start_ns) / 1e6)
         
         # Format result as JSON for LLM consumption
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(result, indent=2, default=str)
-        )]
+        return [_text_content(_dumps(result))]
         
     except Exception as e:
-        server_instance.metrics.record_request(name, time.time() - start_time, False)
-        logger.error(f"Tool {name} execution failed: {e}", exc_info=True)
-        return [types.TextContent(
-            type="text",
-            text=json.dumps({
-                "error": str(e),
-                "tool": name,
-                "arguments": arguments
-            }, indent=2)
-        )]
+        success = False
+        if refill:
+            logger.warning("Tool %s refill failed: %s", name, e)
+        elif isinstance(e, InvalidArgumentsError):
+            # A client mistake rather than a server fault: no traceback needed
+            logger.warning("Tool %s rejected arguments: %s", name, e)
+        elif isinstance(e, _EXPECTED_FAILURES):
+            logger.warning("Tool %s unavailable: %s", name, e)
+        else:
+            logger.error("Tool %s execution failed: %s", name, e, exc_info=True)
+        return [_text_content(_dumps({
+            "error": str(e),
+            "tool": name,
+            "arguments": arguments
+        }))]
+    finally:
+        if not refill:
+            server_instance.metrics.record_request_ns(metric_name, now() - start_ns, success)
 
 async def main():
     """Main entry point for the MCP server."""
-    logger.info("Starting Universal Public Data MCP Server")
+    logger.info("Starting Universal Public Data MCP Server (event loop: %s)",
+                type(asyncio.get_running_loop()).__module__)
+    
+    # Tool schemas and other import-time objects live for the whole process; move them
+    # out of the collector's generations so later collections don't rescan them
+    gc.freeze()
     
     try:
         # Run the server using the same pattern as the working minimal server
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
             logger.info("Stdio server created, starting MCP server...")
-            await server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="universal-public-data",
-                    server_version="1.0.0",
-                    capabilities=types.ServerCapabilities(
-                        tools=types.ToolsCapability(listChanged=False)
+            # Build adapters once the loop is running, overlapping the client handshake
+            # instead of delaying the first tool call
+            asyncio.get_running_loop().call_soon(server_instance._ensure_adapters_initialized)
+            preheat_task = asyncio.ensure_future(_preheater.run()) if _preheat_enabled else None
+            try:
+                await server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="universal-public-data",
+                        server_version="1.0.0",
+                        capabilities=types.ServerCapabilities(
+                            tools=types.ToolsCapability(listChanged=False)
+                        ),
                     ),
-                ),
-            )
+                )
+            finally:
+                if preheat_task is not None:
+                    preheat_task.cancel()
+                await server_instance.aclose()
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Server startup failed: {e}", exc_info=True)
+        logger.error("Server startup failed: %s", e, exc_info=True)
         sys.exit(1)
 
 def run():
+    if uvloop_available:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -1,86 +1,88 @@
 #!/usr/bin/env python3
 """Test minimal MCP server for debugging"""
 
+import asyncio
 import json
-import subprocess
 import sys
-import time
 import os
-import threading
-import queue
 
-def test_minimal_mcp():
+# Largest single line (one JSON-RPC message) accepted from the server's pipes
+_STREAM_LIMIT = 1024 * 1024
+
+async def _forward_stderr(stream: asyncio.StreamReader):
+    """Print server log lines as they arrive."""
+    async for line in stream:
+        line = line.decode(errors="replace").strip()
+        if line:
+            print(f"🔧 STDERR: {line}")
+
+async def _read_response(process, timeout: float):
+    """Return the next JSON message on the server's stdout, or None on timeout or exit."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return None
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=remaining)
+        except asyncio.TimeoutError:
+            return None
+        if not line:
+            print(f"❌ Process exited with code: {await process.wait()}")
+            return None
+
+        line = line.decode(errors="replace").strip()
+        if not line:
+            continue
+        print(f"📥 STDOUT: {line}")
+        if line.startswith('{'):
+            try:
+                return json.loads(line)
+            except json.JSONDecodeError:
+                print(f"⚠ Invalid JSON: {line}")
+
+async def _send(process, request) -> bool:
+    """Write one JSON-RPC request to the server's stdin."""
+    request_json = json.dumps(request)
+    print(f"Request: {request_json}")
+    try:
+        process.stdin.write(request_json.encode() + b"\n")
+        await process.stdin.drain()
+    except Exception as e:
+        print(f"❌ Failed to send request: {e}")
+        return False
+    print("✓ Request sent")
+    return True
+
+async def _run_minimal_mcp():
     print("=" * 60)
     print("MINIMAL MCP SERVER TEST")
     print("=" * 60)
-    
+
+    # Start the minimal server
+    print("🚀 Starting minimal MCP server...")
+
+    # Set environment for better debugging
+    env = os.environ.copy()
+    env["PYTHONUNBUFFERED"] = "1"
+    env["MCP_DEBUG"] = "1"
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-u", "minimal_mcp_server.py",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        limit=_STREAM_LIMIT
+    )
+    print("✓ Process started successfully")
+
+    stderr_task = asyncio.ensure_future(_forward_stderr(process.stderr))
+
     try:
-        # Start the minimal server
-        print("🚀 Starting minimal MCP server...")
-        
-        # Set environment for better debugging
-        env = os.environ.copy()
-        env["PYTHONUNBUFFERED"] = "1"
-        env["MCP_DEBUG"] = "1"
-        
-        process = subprocess.Popen(
-            [sys.executable, "-u", "minimal_mcp_server.py"],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            env=env,
-            bufsize=0  # Unbuffered
-        )
-        
-        print("✓ Process started successfully")
-        
-        # Create output queues
-        stdout_queue = queue.Queue()
-        stderr_queue = queue.Queue()
-        
-        def read_stdout():
-            try:
-                while True:
-                    line = process.stdout.readline()
-                    if not line:
-                        break
-                    stdout_queue.put(line.strip())
-            except Exception as e:
-                stdout_queue.put(f"STDOUT_ERROR: {e}")
-        
-        def read_stderr():
-            try:
-                while True:
-                    line = process.stderr.readline()
-                    if not line:
-                        break
-                    stderr_queue.put(line.strip())
-            except Exception as e:
-                stderr_queue.put(f"STDERR_ERROR: {e}")
-        
-        # Start reader threads
-        stdout_thread = threading.Thread(target=read_stdout, daemon=True)
-        stderr_thread = threading.Thread(target=read_stderr, daemon=True)
-        stdout_thread.start()
-        stderr_thread.start()
-        
-        # Wait for server initialization
-        print("⏳ Waiting for server initialization...")
-        time.sleep(3)
-        
-        # Check stderr for startup logs
-        startup_messages = []
-        try:
-            while not stderr_queue.empty():
-                msg = stderr_queue.get_nowait()
-                if msg.strip():
-                    startup_messages.append(msg)
-                    print(f"🔧 STARTUP: {msg}")
-        except:
-            pass
-        
-        # Send initialize request
+        # The server is ready once it reads stdin, so send initialize right away and
+        # pipeline tools/list behind it; responses come back in request order
         init_request = {
             "jsonrpc": "2.0",
             "id": 1,
@@ -96,109 +98,47 @@ def test_minimal_mcp():
                 }
             }
         }
-        
-        print("📤 Sending initialize request...")
-        request_json = json.dumps(init_request)
-        print(f"Request: {request_json}")
-        
-        try:
-            # Write request
-            process.stdin.write(request_json + "\n")
-            process.stdin.flush()
-            print("✓ Request sent")
-        except Exception as e:
-            print(f"❌ Failed to send request: {e}")
-            process.terminate()
+        tools_request = {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "tools/list"
+        }
+
+        print("📤 Sending initialize and tools list requests...")
+        if not await _send(process, init_request) or not await _send(process, tools_request):
             return False
-        
+
         # Wait for response
         print("⏳ Waiting for response...")
-        response_received = False
-        
-        for i in range(15):  # Wait up to 15 seconds
-            # Check stdout
-            try:
-                while not stdout_queue.empty():
-                    line = stdout_queue.get_nowait()
-                    if line.strip():
-                        print(f"📥 STDOUT: {line}")
-                        if line.strip().startswith('{'):
-                            try:
-                                response = json.loads(line)
-                                print(f"✓ Valid JSON response: {response}")
-                                response_received = True
-                            except json.JSONDecodeError:
-                                print(f"⚠ Invalid JSON: {line}")
-            except:
-                pass
-            
-            # Check stderr
-            try:
-                while not stderr_queue.empty():
-                    line = stderr_queue.get_nowait()
-                    if line.strip():
-                        print(f"🔧 STDERR: {line}")
-            except:
-                pass
-            
-            # Check if process died
-            if process.poll() is not None:
-                print(f"❌ Process exited with code: {process.poll()}")
-                break
-            
-            if response_received:
-                break
-                
-            time.sleep(1)
-        
-        success = response_received
-        
+        response = await _read_response(process, timeout=15)
+        success = response is not None
+
         if success:
-            print("✅ Initialize successful! Testing tools list...")
-            
-            # Send tools list request
-            tools_request = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/list"
-            }
-            
-            tools_json = json.dumps(tools_request)
-            try:
-                process.stdin.write(tools_json + "\n")
-                process.stdin.flush()
-                print("✓ Tools list request sent")
-                
-                # Wait for tools response
-                time.sleep(2)
-                tools_received = False
-                try:
-                    while not stdout_queue.empty():
-                        line = stdout_queue.get_nowait()
-                        if line.strip():
-                            print(f"📥 TOOLS: {line}")
-                            if '"tools"' in line or '"result"' in line:
-                                tools_received = True
-                except:
-                    pass
-                
-                if tools_received:
-                    print("✅ Tools list received!")
-                else:
-                    print("⚠ Tools list not received")
-                    
-            except Exception as e:
-                print(f"❌ Failed to request tools: {e}")
-        
+            print(f"✓ Valid JSON response: {response}")
+            print("✅ Initialize successful! Checking tools list...")
+
+            tools_response = await _read_response(process, timeout=5)
+            if tools_response is not None and "result" in tools_response:
+                print("✅ Tools list received!")
+            else:
+                print("⚠ Tools list not received")
+
+        return success
+
+    finally:
         # Clean up
-        try:
+        if process.returncode is None:
             process.terminate()
-            process.wait(timeout=3)
-        except:
-            process.kill()
-        
-        return success
-        
+            try:
+                await asyncio.wait_for(process.wait(), timeout=3)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        stderr_task.cancel()
+
+def test_minimal_mcp():
+    try:
+        return asyncio.run(_run_minimal_mcp())
     except Exception as e:
         print(f"❌ Test failed: {e}")
         import traceback
@@ -208,10 +148,10 @@ def test_minimal_mcp():
 if __name__ == "__main__":
     print("Testing minimal MCP server...")
     success = test_minimal_mcp()
-    
+
     print("\n" + "=" * 60)
     if success:
         print("✅ MINIMAL MCP SERVER WORKING!")
     else:
         print("❌ MINIMAL MCP SERVER FAILED!")
-    print("=" * 60) 
\ No newline at end of file
+    print("=" * 60)
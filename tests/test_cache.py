@@ -0,0 +1,34 @@
+"""
+Tests for the cache manager.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from cachetools import Cache, TTLCache
+
+from src.core.config import Config
+from src.core.cache import CacheManager
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_swept_until_closed():
+    """Test that the expiry sweep purges expired entries without writes, and stops on aclose."""
+    cache = CacheManager(Config())
+    clock = [0.0]
+    cache.memory_cache = TTLCache(maxsize=10, ttl=1, timer=lambda: clock[0])
+    
+    with patch("src.core.cache.EXPIRE_INTERVAL", 0):
+        await cache.set("quote", {"price": 1})
+        clock[0] = 2.0
+        # Expired but still held: TTLCache only purges when the cache is used
+        assert Cache.__len__(cache.memory_cache) == 1
+        await asyncio.sleep(0.01)
+        assert Cache.__len__(cache.memory_cache) == 0
+        
+        await cache.aclose()
+        # After aclose nothing sweeps: an entry written directly stays until the cache is used
+        cache.memory_cache["quote"] = {"price": 2}
+        clock[0] = 4.0
+        await asyncio.sleep(0.01)
+        assert Cache.__len__(cache.memory_cache) == 1
@@ -0,0 +1,23 @@
+"""
+Tests for configuration loading.
+"""
+
+from src.core.config import Config
+
+def test_config_file_values_are_validated(tmp_path):
+    """Test that values merged from a YAML file are coerced to their field types."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text('cache:\n  default_ttl: "600"\n  enabled: "false"\n')
+    
+    config = Config.load(str(config_file))
+    
+    assert config.cache.default_ttl == 600
+    assert config.cache.enabled is False
+
+def test_api_keys_are_read_on_every_load(monkeypatch):
+    """Test that an API key exported after a first load is picked up by the next one."""
+    monkeypatch.delenv("NASA_API_KEY", raising=False)
+    assert Config.load().api_keys.nasa is None
+    
+    monkeypatch.setenv("NASA_API_KEY", "late-key")
+    assert Config.load().api_keys.nasa == "late-key"
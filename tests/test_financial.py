@@ -3,24 +3,24 @@ Tests for the financial data adapter.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import httpx
 from unittest.mock import Mock, AsyncMock
 
 from src.adapters.financial import FinancialDataAdapter
 from src.core.cache import CacheManager
 from src.core.config import Config
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def financial_adapter():
-    """Create a financial adapter instance for testing."""
+    """Create one financial adapter, and one HTTP client, shared by the whole session."""
     config = Config()
     cache = CacheManager(config)
-    adapter = FinancialDataAdapter(cache)
-    
-    yield adapter
-    
-    # Cleanup
-    await adapter.client.aclose()
+    # Inject a client the way the server shares one across adapters
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        yield FinancialDataAdapter(cache, client)
+    await cache.aclose()
 
 @pytest.mark.asyncio
 async def test_clean_symbol():
@@ -29,7 +29,7 @@ async def test_clean_symbol():
     assert FinancialDataAdapter._clean_symbol("tsla") == "TSLA"
     assert FinancialDataAdapter._clean_symbol("BTC-USD") == "BTC-USD"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_stock_data_structure(financial_adapter):
     """Test that get_stock_data returns proper structure."""
     result = await financial_adapter.get_stock_data("AAPL")
@@ -46,7 +46,7 @@ async def test_get_stock_data_structure(financial_adapter):
         assert "company_name" in result
         assert "current_price" in result
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_crypto_data_structure(financial_adapter):
     """Test that get_crypto_data returns proper structure."""
     result = await financial_adapter.get_crypto_data("bitcoin")
@@ -58,7 +58,7 @@ async def test_get_crypto_data_structure(financial_adapter):
     assert "symbol" in result or "error" in result
     assert "timestamp" in result
 
-@pytest.mark.asyncio 
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_exchange_rates_structure(financial_adapter):
     """Test that get_exchange_rates returns proper structure."""
     result = await financial_adapter.get_exchange_rates("USD", "EUR")
@@ -77,7 +77,7 @@ async def test_get_exchange_rates_structure(financial_adapter):
 
 # Integration tests (require network access)
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_real_stock_data(financial_adapter):
     """Test with real stock data (requires network)."""
     result = await financial_adapter.get_stock_data("AAPL", timeframe="1d")
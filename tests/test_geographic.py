@@ -0,0 +1,39 @@
+"""
+Tests for the geographic data adapter.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock, patch
+
+from src.adapters.geographic import GeographicDataAdapter
+
+@pytest.mark.asyncio
+async def test_location_snapshot_runs_lookups_concurrently():
+    """Test that the snapshot's lookups overlap and a failing one only loses its section."""
+    adapter = GeographicDataAdapter(Mock(), client=Mock())
+    all_started = asyncio.Event()
+    started = []
+    
+    def lookup(section, outcome):
+        async def run(*args, **kwargs):
+            started.append(section)
+            if len(started) == 3:
+                all_started.set()
+            # Only returns if all three lookups are in flight at once
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return run
+    
+    with patch.object(adapter, "get_weather_data", lookup("weather", {"temperature": 21})), \
+            patch.object(adapter, "get_air_quality", lookup("air_quality", RuntimeError("AirNow down"))), \
+            patch.object(adapter, "get_disaster_alerts", lookup("disaster_alerts", {"alerts": []})):
+        result = await adapter.get_location_snapshot("Boston, MA")
+    
+    assert sorted(started) == ["air_quality", "disaster_alerts", "weather"]
+    assert result["location"] == "Boston, MA"
+    assert result["weather"] == {"temperature": 21}
+    assert result["disaster_alerts"] == {"alerts": []}
+    assert "AirNow down" in result["air_quality"]["error"]
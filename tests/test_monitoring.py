@@ -0,0 +1,76 @@
+"""
+Tests for the monitoring and metrics collection system.
+"""
+
+import pytest
+
+from src.core.monitoring import MetricsCollector, HealthMonitor, DashboardGenerator
+
+@pytest.fixture
+def metrics():
+    """Create a fresh metrics collector for testing."""
+    return MetricsCollector(max_history=10)
+
+def test_record_request_updates_counters(metrics):
+    """Test that requests and errors are counted globally and per API."""
+    metrics.record_request("nasa", 0.2, True)
+    metrics.record_request("nasa", 0.4, False)
+    
+    performance = metrics.get_performance_metrics()
+    assert performance["total_requests"] == 2
+    assert performance["total_errors"] == 1
+    assert performance["error_rate_percent"] == pytest.approx(50.0)
+    
+    api_metrics = metrics.get_api_metrics()
+    assert api_metrics["nasa"]["requests"] == 2
+    assert api_metrics["nasa"]["errors"] == 1
+    assert api_metrics["nasa"]["avg_response_time_ms"] == pytest.approx(300.0)
+    assert isinstance(api_metrics["nasa"]["last_request"], str)
+
+def test_record_request_ns_matches_seconds(metrics):
+    """Test that nanosecond and second response times are accounted the same way."""
+    metrics.record_request_ns("nasa", 1_500, True)
+    metrics.record_request("nasa", 0.0000025, True)
+    
+    assert metrics.get_api_metrics()["nasa"]["avg_response_time_ms"] == pytest.approx(0.002)
+    assert metrics.get_performance_metrics()["avg_response_time_ms"] == pytest.approx(0.002)
+
+def test_metric_history_is_bounded_and_ordered(metrics):
+    """Test that metric history keeps only the most recent points in order."""
+    for i in range(15):
+        metrics.record_metric("queue.depth", float(i))
+    
+    history = metrics.get_metric_history("queue.depth", limit=100)
+    assert [point["value"] for point in history] == [float(i) for i in range(5, 15)]
+    assert isinstance(history[0]["timestamp"], str)
+    
+    assert [point["value"] for point in metrics.get_metric_history("queue.depth", limit=3)] == [12.0, 13.0, 14.0]
+    assert metrics.get_metric_history("missing") == []
+
+def test_metric_history_merges_tagged_points(metrics):
+    """Test that tagged and tag-less points of one metric are returned together."""
+    metrics.record_metric("api.calls", 1.0, tags={"region": "us"})
+    metrics.record_metric("api.calls", 2.0)
+    
+    history = metrics.get_metric_history("api.calls")
+    assert [point["value"] for point in history] == [1.0, 2.0]
+    assert [point["tags"] for point in history] == [{"region": "us"}, {}]
+
+def test_request_metric_histories(metrics):
+    """Test the per-API response time, request and error histories."""
+    metrics.record_request("news", 0.1, True)
+    metrics.record_request("news", 0.3, False)
+    
+    assert [p["value"] for p in metrics.get_metric_history("api.news.response_time")] == [0.1, 0.3]
+    assert [p["value"] for p in metrics.get_metric_history("api.news.requests")] == [1.0, 1.0]
+    assert len(metrics.get_metric_history("api.news.errors")) == 1
+
+@pytest.mark.asyncio
+async def test_generate_dashboard_structure(metrics):
+    """Test that the dashboard contains every section."""
+    health = HealthMonitor(metrics)
+    dashboard = await DashboardGenerator(metrics, health).generate_dashboard()
+    
+    for section in ("timestamp", "system", "performance", "apis", "health", "recent_alerts", "uptime"):
+        assert section in dashboard
+    assert dashboard["uptime"]["uptime_seconds"] >= 0
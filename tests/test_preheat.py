@@ -0,0 +1,43 @@
+"""
+Tests for predictive cache preheating.
+"""
+
+import pytest
+
+from src.core.preheat import CountMinSketch, Preheater
+
+def test_count_min_sketch_estimates_and_decays():
+    """Test that estimates track added counts and halve on decay."""
+    sketch = CountMinSketch(width=64, depth=4)
+    for _ in range(6):
+        sketch.add("popular")
+    sketch.add("rare")
+    
+    assert sketch.estimate("popular") >= 6
+    assert sketch.estimate("rare") >= 1
+    
+    sketch.decay()
+    assert sketch.estimate("popular") >= 3
+    assert sketch.estimate("popular") < 6
+
+@pytest.mark.asyncio
+async def test_preheat_refills_only_recurring_calls():
+    """Test that only calls seen min_count times are refilled, and stale ones are forgotten."""
+    refilled = []
+    
+    async def refill(payload):
+        refilled.append(payload)
+    
+    preheater = Preheater(refill, min_count=3)
+    for _ in range(4):
+        preheater.record("AAPL", {"symbol": "AAPL"})
+    preheater.record("TSLA", {"symbol": "TSLA"})
+    
+    await preheater.preheat_once()
+    assert refilled == [{"symbol": "AAPL"}]
+    assert "TSLA" not in preheater.hot_keys()
+    
+    # Without new traffic the counts decay and the calls drop out
+    for _ in range(3):
+        await preheater.preheat_once()
+    assert preheater.hot_keys() == []
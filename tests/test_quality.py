@@ -0,0 +1,139 @@
+"""
+Tests for the data quality validation and enhancement system.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.core.quality import DataValidator, QualityEnhancer, QualityLevel
+
+def test_generic_validation_flags_errors_and_empty_fields():
+    """Test that error payloads and empty fields lower the quality score."""
+    result = DataValidator().validate_data("unknown", {"error": "boom", "value": None})
+    
+    assert result["quality_score"] == 0
+    assert result["quality_level"] == QualityLevel.POOR.value
+    assert "Data contains error message" in result["issues"]
+    assert "Empty fields: ['value']" in result["issues"]
+
+def test_financial_validation_checks_symbol_and_price():
+    """Test symbol format and price checks for financial data."""
+    validator = DataValidator()
+    
+    good = validator.validate_data("financial", {
+        "symbol": "AAPL",
+        "current_price": 190.5,
+        "timestamp": datetime.now().isoformat()
+    })
+    assert good["issues"] == []
+    assert good["quality_level"] == QualityLevel.EXCELLENT.value
+    
+    bad = validator.validate_data("financial", {"symbol": "aapl!", "current_price": -1, "volume": "n/a"})
+    assert "Symbol format may be invalid" in bad["issues"]
+    assert "Invalid price (zero or negative)" in bad["issues"]
+    assert "Invalid numeric value in volume" in bad["issues"]
+
+def test_technology_validation_checks_domain():
+    """Test domain format validation."""
+    validator = DataValidator()
+    
+    assert "Invalid domain format" not in validator.validate_data("technology", {"domain": "example.com"})["issues"]
+    assert "Invalid domain format" in validator.validate_data("technology", {"domain": "-bad-.com"})["issues"]
+
+def test_geographic_validation_checks_ranges():
+    """Test coordinate and temperature range checks."""
+    result = DataValidator().validate_data("geographic", {"lat": 120, "lon": "x", "temperature": 80})
+    
+    assert "Invalid latitude range" in result["issues"]
+    assert "Invalid longitude format" in result["issues"]
+    assert "Temperature outside expected range" in result["issues"]
+
+def test_enhance_data_adds_metadata():
+    """Test that enhancement adds quality and context metadata."""
+    data = {"articles": [{"title": "abc", "source": "x"}, {"title": "abcde", "source": "y"}]}
+    enhanced = QualityEnhancer().enhance_data("news", data)
+    
+    assert "_quality" in enhanced
+    assert enhanced["_insights"]["article_count"] == 2
+    assert enhanced["_insights"]["avg_title_length"] == 4
+    assert enhanced["_insights"]["sources_count"] == 2
+    assert enhanced["_enhanced"]["original_field_count"] == 1
+
+@pytest.mark.asyncio
+async def test_batch_validation_preserves_order():
+    """Test that batch validation returns one result per item, in order."""
+    validator = DataValidator()
+    items = [{"symbol": "AAPL"}, {"symbol": "bad!"}]
+    
+    async_results = await validator.validate_batch("financial", items)
+    sync_results = validator.validate_many("financial", items)
+    
+    for results in (async_results, sync_results):
+        assert len(results) == 2
+        assert "Symbol format may be invalid" not in results[0]["issues"]
+        assert "Symbol format may be invalid" in results[1]["issues"]
+
+def test_timestamp_age_accepts_utc_suffix():
+    """Test that UTC "Z" timestamps are parsed and compared with local time."""
+    validator = DataValidator()
+    fresh = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    
+    assert validator.validate_data("unknown", {"timestamp": fresh})["issues"] == ["Limited data fields"]
+    assert "Invalid timestamp format" in validator.validate_data("unknown", {"timestamp": "yesterday"})["issues"]
+    
+    old = validator.validate_data("unknown", {"timestamp": "2000-01-01T00:00:00Z"})
+    assert any(issue.startswith("Data is") for issue in old["issues"])
+
+def test_news_bulk_validation_counts_all_articles():
+    """Test that bulk news validation checks every article, not just the first five."""
+    articles = [{"title": "t", "description": "d", "url": "u"}] * 9 + [{"title": "", "summary": None}]
+    result = DataValidator().validate_data("news_bulk", {"articles": articles, "sources": ["a", "b"]})
+    
+    assert "1 of 10 articles missing title" in result["issues"]
+    assert "1 of 10 articles missing description" in result["issues"]
+    assert "1 of 10 articles missing link" in result["issues"]
+    assert result["news_specific"] is True
+
+def test_validation_results_are_cached_by_content():
+    """Test that identical payloads reuse cached results while timestamped ones are revalidated."""
+    validator = DataValidator(cache_size=1)
+    
+    first = validator.validate_data("financial", {"symbol": "bad!"})
+    first["issues"].append("mutated by caller")
+    second = validator.validate_data("financial", {"symbol": "bad!"})
+    
+    assert second["issues"] == ["Symbol format may be invalid", "Limited data fields"]
+    assert second["quality_score"] == first["quality_score"]
+    assert len(validator._result_cache) == 1
+    
+    validator.validate_data("financial", {"symbol": "AAPL"})
+    assert len(validator._result_cache) == 1
+    
+    validator.validate_data("financial", {"symbol": "AAPL", "timestamp": datetime.now().isoformat()})
+    assert len(validator._result_cache) == 1
+
+def test_error_payloads_short_circuit_typed_validation():
+    """Test that type-specific validators score error payloads as zero without further checks."""
+    result = DataValidator().validate_data("nasa", {"error": "rate limited", "dataset": "apod"})
+    
+    assert result["quality_score"] == 0
+    assert result["quality_level"] == QualityLevel.POOR.value
+    assert result["issues"] == ["Data contains error message"]
+    assert result["nasa_specific"] is True
+    assert result["dataset"] == "apod"
+
+def test_geographic_bulk_validation_counts_bad_points():
+    """Test that bulk geographic validation counts bad coordinates and temperatures across all points."""
+    points = [
+        {"lat": 10, "lon": 20, "temperature": 15},
+        {"lat": 95, "lon": "x", "temperature": 15},
+        {"lat": "45.5", "lon": 200, "temp_c": 75},
+        {"lon": 0}
+    ]
+    result = DataValidator().validate_data("geographic_bulk", {"points": points})
+    
+    assert "2 of 4 points with invalid latitude" in result["issues"]
+    assert "2 of 4 points with invalid longitude" in result["issues"]
+    assert "1 of 4 points with temperature outside expected range" in result["issues"]
+    assert result["geographic_specific"] is True
@@ -0,0 +1,26 @@
+"""
+Tests for the resilience utilities.
+"""
+
+import pytest
+
+from src.core.resilience import HealthChecker
+
+@pytest.mark.asyncio
+async def test_health_checks_are_fresh_unless_ttl_given():
+    """Test that every check runs by default and results are reused only within an explicit ttl."""
+    checker = HealthChecker()
+    calls = []
+    
+    async def check():
+        calls.append(1)
+        if len(calls) > 1:
+            raise ConnectionError("service down")
+    
+    assert (await checker.check_service_health("nasa", check))["status"] == "healthy"
+    assert (await checker.check_service_health("nasa", check))["status"] == "unhealthy"
+    assert len(calls) == 2
+    
+    reused = await checker.check_service_health("nasa", check, ttl=60)
+    assert reused["status"] == "unhealthy"
+    assert len(calls) == 2
@@ -0,0 +1,206 @@
+"""
+Tests for the MCP server's tool dispatch.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
+
+from src import server
+
+def _reset_server_state():
+    """Forget cached responses, running calls and bound tools (and with them the breakers)."""
+    server._monitoring_cache.clear()
+    server._monitoring_refreshes.clear()
+    server._inflight.clear()
+    server._bound_tools.clear()
+
+@pytest_asyncio.fixture(autouse=True)
+async def clean_server_state():
+    """Start and leave every test with fresh module-level server state."""
+    _reset_server_state()
+    yield
+    _reset_server_state()
+    await server.server_instance.aclose()
+
+@pytest_asyncio.fixture
+async def bound_tools():
+    """Bind adapter tools, with fresh breakers, on the test's event loop."""
+    server._bind_adapter_tools()
+    return server._bound_tools
+
+def _payload(content):
+    return json.loads(content[0].text)
+
+def test_dumps_matches_with_and_without_orjson():
+    """Test that tool output is identical whether or not orjson is installed."""
+    payload = {
+        "when": datetime(2024, 1, 1, 12, 0, 0, 123456),
+        "day": date(2024, 1, 1),
+        "at": time(9, 30),
+        "price": Decimal("101.25"),
+        "values": [1, 2.5, None, "x"]
+    }
+    
+    with patch.object(server, "orjson_available", False):
+        fallback = server._dumps(payload)
+    assert json.loads(fallback)["when"] == "2024-01-01T12:00:00.123456"
+    assert json.loads(fallback)["at"] == "09:30:00"
+    
+    if server.orjson_available:
+        assert server._dumps(payload) == fallback
+
+@pytest.mark.asyncio
+async def test_unknown_arguments_are_rejected(caplog):
+    """Test that arguments outside a tool's schema fail validation before dispatch."""
+    if not server._validate_arguments:
+        pytest.skip("fastjsonschema not installed")
+    
+    with caplog.at_level(logging.WARNING, logger=server.logger.name):
+        result = _payload(await server._call_tool("get_stock_data", {"symbol": "AAPL", "bogus": 1}))
+    assert "Input validation error" in result["error"]
+    
+    # A client mistake is logged as a warning, without a traceback
+    records = [r for r in caplog.records if r.name == server.logger.name and r.levelno >= logging.WARNING]
+    assert [r.levelno for r in records] == [logging.WARNING]
+    assert records[0].exc_info is None
+
+@pytest.mark.asyncio
+async def test_malformed_calls_do_not_open_circuit(bound_tools):
+    """Test that errors caused by a client's arguments never trip the tool's breaker."""
+    _, semaphore, metric_name, breaker = bound_tools["get_stock_data"]
+    
+    async def get_stock_data(**kwargs):
+        raise TypeError("get_stock_data() got an unexpected keyword argument 'bogus'")
+    
+    with patch.dict(bound_tools, {"get_stock_data": (get_stock_data, semaphore, metric_name, breaker)}), \
+            patch.object(server, "_validate_arguments", False):
+        for _ in range(server._BREAKER_THRESHOLD + 1):
+            result = _payload(await server._call_tool("get_stock_data", {"symbol": "AAPL", "bogus": 1}))
+            assert "unexpected keyword argument" in result["error"]
+    
+    assert breaker.failure_count == 0
+    assert breaker.state.value == "closed"
+
+@pytest.mark.asyncio
+async def test_only_timeouts_open_circuit(bound_tools):
+    """Test that fast upstream failures pass through while repeated timeouts open the circuit."""
+    _, semaphore, metric_name, breaker = bound_tools["get_stock_data"]
+    
+    async def get_stock_data(symbol):
+        if symbol == "SLOW":
+            await asyncio.sleep(1)
+        # Adapters catch upstream errors and report them in the result
+        return {"error": "Failed to get stock data: connection refused", "symbol": symbol}
+    
+    with patch.dict(bound_tools, {"get_stock_data": (get_stock_data, semaphore, metric_name, breaker)}), \
+            patch.object(server, "_TOOL_TIMEOUT", 0.01):
+        for _ in range(server._BREAKER_THRESHOLD + 1):
+            result = _payload(await server._call_tool("get_stock_data", {"symbol": "AAPL"}))
+            assert "connection refused" in result["error"]
+        assert breaker.state.value == "closed"
+        
+        for _ in range(server._BREAKER_THRESHOLD):
+            result = _payload(await server._call_tool("get_stock_data", {"symbol": "SLOW"}))
+            assert "timed out" in result["error"]
+        result = _payload(await server._call_tool("get_stock_data", {"symbol": "AAPL"}))
+    
+    assert breaker.state.value == "open"
+    assert "Circuit breaker is OPEN" in result["error"]
+
+@pytest.mark.asyncio
+async def test_preheater_records_only_successful_calls(bound_tools):
+    """Test that invalid or failing calls never become preheat candidates."""
+    _, semaphore, metric_name, breaker = bound_tools["get_stock_data"]
+    
+    async def get_stock_data(symbol):
+        if symbol == "FAIL":
+            return {"error": "upstream error", "symbol": symbol}
+        return {"symbol": symbol}
+    
+    preheater = server.Preheater(server._refill)
+    with patch.dict(bound_tools, {"get_stock_data": (get_stock_data, semaphore, metric_name, breaker)}), \
+            patch.object(server, "_preheater", preheater), \
+            patch.object(server, "_preheat_enabled", True):
+        for _ in range(3):
+            await server.handle_call_tool("get_stock_data", {"symbol": "AAPL", "bogus": 1})
+            await server.handle_call_tool("get_stock_data", {"symbol": "FAIL"})
+            await server.handle_call_tool("get_stock_data", {"symbol": "AAPL"})
+    
+    assert preheater.hot_keys() == [("get_stock_data", server._arguments_key({"symbol": "AAPL"}))]
+
+@pytest.mark.asyncio
+async def test_refill_bypasses_breaker_and_is_joined_by_users(bound_tools):
+    """Test that refill failures don't count against the tool and users coalesce onto refills."""
+    _, semaphore, metric_name, breaker = bound_tools["get_stock_data"]
+    calls = []
+    release = asyncio.Event()
+    
+    async def get_stock_data(symbol):
+        calls.append(symbol)
+        if symbol == "DOWN":
+            await asyncio.sleep(1)
+        await release.wait()
+        return {"symbol": symbol}
+    
+    key = ("get_stock_data", server._arguments_key({"symbol": "AAPL"}))
+    down_key = ("get_stock_data", server._arguments_key({"symbol": "DOWN"}))
+    with patch.dict(bound_tools, {"get_stock_data": (get_stock_data, semaphore, metric_name, breaker)}), \
+            patch.object(server, "_TOOL_TIMEOUT", 0.01):
+        # Refills that time out would open the breaker if they went through it
+        for _ in range(server._BREAKER_THRESHOLD):
+            await server._refill((down_key, {"symbol": "DOWN"}))
+        assert breaker.failure_count == 0
+        
+        refill = asyncio.ensure_future(server._refill((key, {"symbol": "AAPL"})))
+        await asyncio.sleep(0)
+        user_call = asyncio.ensure_future(server.handle_call_tool("get_stock_data", {"symbol": "AAPL"}))
+        await asyncio.sleep(0)
+        release.set()
+        await refill
+        result = _payload(await user_call)
+    
+    assert result == {"symbol": "AAPL"}
+    assert calls.count("AAPL") == 1
+
+@pytest.mark.asyncio
+async def test_monitoring_cache_is_bounded():
+    """Test that distinct monitoring arguments can't grow the response cache without limit."""
+    for i in range(server._MONITORING_CACHE_SIZE * 2):
+        await server._call_tool("get_api_metrics", {"api_name": f"api-{i}"})
+    
+    assert len(server._monitoring_cache) <= server._MONITORING_CACHE_SIZE
+    assert server._monitoring_refreshes == {}
+
+def test_validation_does_not_mutate_arguments():
+    """Test that schema defaults are not written into the validated arguments."""
+    if not server._validate_arguments:
+        pytest.skip("fastjsonschema not installed")
+    
+    arguments = {"symbol": "AAPL"}
+    server._validate_tool_arguments("get_stock_data", arguments)
+    assert arguments == {"symbol": "AAPL"}
+
+@pytest.mark.asyncio
+async def test_tools_work_after_aclose(bound_tools):
+    """Test that closing the server drops its adapters so the next call rebuilds them."""
+    closed_client = server.server_instance.http
+    await server.server_instance.aclose()
+    assert server._bound_tools == {}
+    
+    async def get_stock_data(adapter, symbol):
+        # Called on the rebuilt adapter, which must not hold the closed client
+        assert not adapter.client.is_closed
+        return {"symbol": symbol}
+    
+    with patch.object(server.FinancialDataAdapter, "get_stock_data", get_stock_data):
+        result = _payload(await server._call_tool("get_stock_data", {"symbol": "AAPL"}))
+    
+    assert result == {"symbol": "AAPL"}
+    assert server.server_instance.http is not closed_client
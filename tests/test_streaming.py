@@ -0,0 +1,180 @@
+"""
+Tests for the real-time data streaming system.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from src.core.streaming import DataStream, StreamManager
+
+@pytest.mark.asyncio
+async def test_notify_runs_sync_and_async_subscribers():
+    """Test that both subscriber kinds are notified and failing ones are dropped."""
+    stream = DataStream("test", "news")
+    received = []
+    
+    async def async_subscriber(data):
+        await asyncio.sleep(0)
+        received.append(("async", data["n"]))
+    
+    async def failing_subscriber(data):
+        raise RuntimeError("boom")
+    
+    def sync_subscriber(data):
+        received.append(("sync", data["n"]))
+    
+    stream.subscribe(sync_subscriber)
+    stream.subscribe(async_subscriber)
+    stream.subscribe(failing_subscriber)
+    
+    await stream._notify_subscribers({"n": 1})
+    
+    assert sorted(received) == [("async", 1), ("sync", 1)]
+    assert len(stream.subscribers) == 2
+    assert failing_subscriber not in stream.subscribers
+
+@pytest.mark.asyncio
+async def test_subscriber_kind_is_detected_once_at_subscribe():
+    """Test that callables with an async __call__ are treated as async subscribers."""
+    class AsyncSink:
+        def __init__(self):
+            self.items = []
+        
+        async def __call__(self, data):
+            self.items.append(data)
+    
+    stream = DataStream("test", "news")
+    sink = AsyncSink()
+    stream.subscribe(sink)
+    
+    assert stream.subscribers == {sink}
+    await stream._notify_subscribers({"n": 1})
+    assert sink.items == [{"n": 1}]
+
+@pytest.mark.asyncio
+async def test_inline_subscribers_are_kept():
+    """Test that subscribers are held strongly by default, so inline callbacks keep receiving."""
+    stream = DataStream("test", "news")
+    received = []
+    stream.subscribe(lambda data: received.append(data["n"]))
+    
+    await stream._notify_subscribers({"n": 1})
+    
+    assert received == [1]
+    assert stream.subscriber_count == 1
+
+@pytest.mark.asyncio
+async def test_weak_subscribers_are_dropped_when_collected():
+    """Test that weak subscribers vanish once their owner is collected."""
+    class Listener:
+        def __init__(self):
+            self.items = []
+        
+        def on_data(self, data):
+            self.items.append(data)
+    
+    stream = DataStream("test", "news")
+    kept = Listener()
+    dropped = Listener()
+    stream.subscribe(kept.on_data, weak=True)
+    stream.subscribe(dropped.on_data, weak=True)
+    assert len(stream.subscribers) == 2
+    
+    del dropped
+    await stream._notify_subscribers({"n": 1})
+    
+    assert kept.items == [{"n": 1}]
+    assert len(stream.subscribers) == 1
+    
+    stream.unsubscribe(kept.on_data)
+    assert len(stream.subscribers) == 0
+
+@pytest.mark.asyncio
+async def test_stream_status_formats_last_update():
+    """Test that the raw payload timestamp is rendered as ISO text in the stream status."""
+    manager = StreamManager()
+    stream = await manager.create_stream("breaking_news")
+    stream.last_data = await stream._fetch_data()
+    
+    status = manager.get_stream_status()["streams"]["breaking_news"]
+    assert datetime.fromisoformat(status["last_update"]).year >= 2024
+
+@pytest.mark.asyncio
+async def test_stream_notifies_only_on_content_change():
+    """Test that payloads differing only in their timestamp do not trigger notifications."""
+    stream = DataStream("test", "news", update_interval=0)
+    received = []
+    
+    def on_data(data):
+        received.append(data)
+    
+    stream.subscribe(on_data)
+    await stream.start()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    await stream.stop()
+    
+    assert len(received) == 1
+
+@pytest.mark.asyncio
+async def test_subscribers_can_receive_preencoded_payload():
+    """Test that callbacks taking `encoded` get the payload as JSON bytes alongside the dict."""
+    stream = DataStream("test", "news")
+    plain = []
+    raw = []
+    
+    def on_data(data):
+        plain.append(data)
+    
+    async def on_bytes(data, encoded=None):
+        raw.append(encoded)
+    
+    stream.subscribe(on_data)
+    stream.subscribe(on_bytes)
+    await stream._notify_subscribers({"n": 1})
+    
+    assert plain == [{"n": 1}]
+    assert len(raw) == 1 and json.loads(raw[0]) == {"n": 1}
+
+@pytest.mark.asyncio
+async def test_slow_subscribers_do_not_block_fetching():
+    """Test that updates queue for delivery while a slow subscriber is still busy."""
+    class CountingStream(DataStream):
+        __slots__ = ("count",)
+        
+        async def _fetch_data(self):
+            self.count += 1
+            return {"n": self.count}
+    
+    stream = CountingStream("test", "news", update_interval=0)
+    stream.count = 0
+    received = []
+    release = asyncio.Event()
+    
+    async def slow_subscriber(data):
+        await release.wait()
+        received.append(data["n"])
+    
+    stream.subscribe(slow_subscriber)
+    await stream.start()
+    for _ in range(100):
+        await asyncio.sleep(0)
+    
+    assert stream.count > DataStream.OUTBOX_SIZE
+    assert received == []
+    release.set()
+    await stream.stop()
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_stream_tasks():
+    """Test that stopping a stream leaves no running tasks behind."""
+    stream = DataStream("test", "news", update_interval=60)
+    await stream.start()
+    tasks = [stream.task, stream._drain_task]
+    await stream.stop()
+    
+    assert all(task.done() for task in tasks)
+    assert stream.task is None